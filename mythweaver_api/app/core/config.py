@@ -1,5 +1,6 @@
 from pydantic_settings import BaseSettings
 from typing import Optional
+from functools import lru_cache
 import os
 
 
@@ -26,6 +27,7 @@ class Settings(BaseSettings):
     JWT_SECRET_KEY: str = "your-super-secret-jwt-key-change-in-production"
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
+    BCRYPT_ROUNDS: int = 12  # Cost factor: each extra round doubles hashing time; tests lower it
     
     # AI APIs
     OPENAI_API_KEY: Optional[str] = None
@@ -49,4 +51,10 @@ class Settings(BaseSettings):
         case_sensitive = True
 
 
-settings = Settings()
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build the settings (env vars, .env file, validation) once per process"""
+    return Settings()
+
+
+settings = get_settings()
\ No newline at end of file
@@ -15,10 +15,10 @@ from app.schemas.campaign import (
     CreateCampaignResponse,
     CampaignResponse,
 )
-from app.schemas.character import CharacterResponse
 from app.services.campaign_service import (
     create_campaign,
     get_campaign,
+    build_character_response,
     CampaignCreationError,
 )
 
@@ -40,7 +40,8 @@ async def create_new_campaign(
     3. Creates a campaign and character in the database
     4. Loads the campaign template
     5. Generates the opening narration based on character origin
-    6. Returns the campaign ID, character ID, opening narration, and suggested actions
+    6. Returns the campaign and character IDs, opening narration, suggested actions
+       and the created character
     
     **Validation Rules:**
     - Attributes must sum to 15
@@ -106,30 +107,7 @@ async def get_campaign_by_id(
         
         # Add character if it exists
         if campaign.character:
-            char = campaign.character
-            response.character = CharacterResponse(
-                id=char.id,
-                campaign_id=char.campaign_id,
-                name=char.name,
-                origin_id=char.origin,
-                path_id=char.path,
-                might_score=char.might_score,
-                agility_score=char.agility_score,
-                wits_score=char.wits_score,
-                presence_score=char.presence_score,
-                current_hp=char.current_hp,
-                max_hp=char.max_hp,
-                current_focus=char.current_focus,
-                max_focus=char.max_focus,
-                supplies=char.supplies,
-                inventory_slots=char.inventory_slots,
-                skills=char.skills,
-                talents=char.talents,
-                bonds=char.bonds,
-                inventory=char.inventory,
-                created_at=char.created_at,
-                updated_at=char.updated_at,
-            )
+            response.character = build_character_response(campaign.character)
         
         return response
         
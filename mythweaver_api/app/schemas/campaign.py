@@ -30,6 +30,9 @@ class CreateCampaignResponse(BaseModel):
     opening_narration: str
     suggested_actions: List[str]
     
+    # The freshly created character, so clients needn't fetch the campaign again
+    character: CharacterResponse
+    
     model_config = ConfigDict(from_attributes=True)
 
 
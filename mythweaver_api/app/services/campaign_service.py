@@ -10,6 +10,7 @@ from sqlalchemy import select
 from app.models.campaign import Campaign
 from app.models.character import Character
 from app.schemas.campaign import CreateCampaignRequest, CreateCampaignResponse
+from app.schemas.character import CharacterResponse
 from app.services.rules_engine import (
     validate_character_creation,
     calculate_max_hp,
@@ -30,6 +31,33 @@ class CampaignCreationError(Exception):
     pass
 
 
+def build_character_response(character: Character) -> CharacterResponse:
+    """Map a Character row onto its response schema (origin/path become *_id)."""
+    return CharacterResponse(
+        id=character.id,
+        campaign_id=character.campaign_id,
+        name=character.name,
+        origin_id=character.origin,
+        path_id=character.path,
+        might_score=character.might_score,
+        agility_score=character.agility_score,
+        wits_score=character.wits_score,
+        presence_score=character.presence_score,
+        current_hp=character.current_hp,
+        max_hp=character.max_hp,
+        current_focus=character.current_focus,
+        max_focus=character.max_focus,
+        supplies=character.supplies,
+        inventory_slots=character.inventory_slots,
+        skills=character.skills,
+        talents=character.talents,
+        bonds=character.bonds,
+        inventory=character.inventory,
+        created_at=character.created_at,
+        updated_at=character.updated_at,
+    )
+
+
 async def create_campaign(
     request: CreateCampaignRequest,
     user_id: UUID,
@@ -44,7 +72,8 @@ async def create_campaign(
         db: Database session
         
     Returns:
-        CreateCampaignResponse with campaign_id, character_id, opening narration, and suggested actions
+        CreateCampaignResponse with campaign_id, character_id, opening narration, suggested actions
+        and the created character
         
     Raises:
         CampaignCreationError: If campaign creation fails
@@ -143,6 +172,7 @@ async def create_campaign(
             character_id=character.id,
             opening_narration=opening_narration,
             suggested_actions=suggested_actions,
+            character=build_character_response(character),
         )
         
     except CampaignCreationError:
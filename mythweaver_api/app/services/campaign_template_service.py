@@ -31,9 +31,11 @@ def load_campaign_template(template_id: str) -> Optional[Dict]:
         return json.load(f)
 
 
+@lru_cache(maxsize=64)
 def get_opening_narration(template_id: str, origin_id: str) -> str:
     """
     Generate opening narration for a campaign based on template and character origin
+    Cached per (template, origin) pair; the text is immutable once rendered
     
     Args:
         template_id: Campaign template ID
@@ -37,6 +37,10 @@ class CheckResult:
     edge_type: EdgeType
 
 
+# Outcomes indexed by how many margin thresholds were met (see classify_outcome)
+_OUTCOMES = (Outcome.FAILURE, Outcome.NEAR_MISS, Outcome.SUCCESS, Outcome.STRONG_SUCCESS)
+
+
 # Core Dice Logic
 
 def roll_d12() -> int:
@@ -62,6 +66,14 @@ def calculate_skill_rank(score: int) -> int:
 
 # Check Resolution
 
+def classify_outcome(margin: int) -> Outcome:
+    """
+    Map a check margin to its Outcome without a branch chain.
+    Thresholds: -2 (near miss), 0 (success), 5 (strong success)
+    """
+    return _OUTCOMES[(margin >= -2) + (margin >= 0) + (margin >= 5)]
+
+
 def perform_check(
     attribute_score: int,
     skill_score: int,
@@ -107,14 +119,7 @@ def perform_check(
     margin = total - difficulty
     
     # Determine outcome
-    if margin >= 5:
-        outcome = Outcome.STRONG_SUCCESS
-    elif margin >= 0:
-        outcome = Outcome.SUCCESS
-    elif margin >= -2:
-        outcome = Outcome.NEAR_MISS
-    else:
-        outcome = Outcome.FAILURE
+    outcome = classify_outcome(margin)
     
     return CheckResult(
         total=total,
@@ -12,7 +12,7 @@ from ..models.user import User
 from ..schemas.auth import TokenData
 
 # Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=settings.BCRYPT_ROUNDS)
 
 # JWT authentication
 security = HTTPBearer()
@@ -0,0 +1,19 @@
+import asyncio
+import sys
+
+
+def install_uvloop() -> bool:
+    """
+    Use uvloop's event loop for asyncio.run() in the CLI scripts.
+    uvloop only arrives through uvicorn[standard] and has no Windows build,
+    so fall back to the default loop when it isn't available.
+    Returns True if uvloop was installed.
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -0,0 +1,58 @@
+"""
+Shared fixtures for the standalone database scripts in this directory
+Loading this conftest also reads .env for them, so the scripts don't each do it
+
+The scripts carry xdist_group marks so they can run on separate workers:
+    pytest -n 3 --dist loadgroup test_config.py test_db_connection.py test_database_integrity.py
+"""
+import os
+from contextlib import ExitStack
+
+import pytest
+
+# Only read .env when the environment hasn't already provided the database URL
+if not os.getenv("DATABASE_URL"):
+    try:
+        from dotenv import load_dotenv
+        load_dotenv()
+    except ImportError:
+        pass
+
+
+def pytest_configure(config):
+    # Keep the marks warning-free when pytest-xdist isn't installed
+    config.addinivalue_line("markers", "xdist_group(name): run on the same xdist worker as its group")
+
+
+@pytest.fixture(scope="session")
+def database_url():
+    """The configured DATABASE_URL; skips (rather than aborting the session) when unset"""
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        pytest.skip("DATABASE_URL not found in the environment or .env file")
+    return url
+
+
+@pytest.fixture(scope="session")
+def db_conn(database_url):
+    """One pooled psycopg2 connection shared by every script run in the session"""
+    # Imported here so loading this conftest doesn't build the app settings
+    # before tests/conftest.py has applied its environment overrides
+    import psycopg2
+    from tests._dbpool import borrow
+    
+    with ExitStack() as stack:
+        try:
+            conn = stack.enter_context(borrow())
+        except psycopg2.OperationalError as e:
+            pytest.fail(
+                f"❌ Connection failed: {e}\n"
+                "💡 Troubleshooting tips:\n"
+                "   1. Check your DATABASE_URL password in .env file\n"
+                "   2. Verify your Supabase project is active\n"
+                "   3. Check if your IP is allowed in Supabase (Project Settings → Database → Connection Pooling)",
+                pytrace=False,
+            )
+        # Most scripts only run read-only probes, which need no transaction
+        conn.autocommit = True
+        yield conn
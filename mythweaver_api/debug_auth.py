@@ -3,13 +3,39 @@
 Debug script to test auth components in isolation
 """
 import asyncio
+import hashlib
 import sys
 import os
+import tempfile
+from pathlib import Path
 
 # Add the app directory to the path
 sys.path.insert(0, '/app')
 
-async def test_auth_components():
+# bcrypt hashes of test passwords are reused across runs (pass --fresh to rehash)
+_CACHED_HASH_DIR = Path(tempfile.gettempdir())
+
+
+def _cached_hash_path(password: str) -> Path:
+    """Cache file for password; a changed credential maps to a new file"""
+    fingerprint = hashlib.sha256(password.encode()).hexdigest()[:16]
+    return _CACHED_HASH_DIR / f"mw_debug_hash_{fingerprint}.txt"
+
+
+def load_or_create_hash(password: str, fresh: bool = False) -> str:
+    """Return a cached bcrypt hash for password, hashing only on a cache miss"""
+    from app.utils.auth import get_password_hash
+    
+    cache_path = _cached_hash_path(password)
+    if not fresh and cache_path.exists():
+        return cache_path.read_text().strip()
+    
+    hashed = get_password_hash(password)
+    cache_path.write_text(hashed)
+    return hashed
+
+
+async def test_auth_components(fresh: bool = False):
     print("🔍 Testing Auth Components...")
     
     try:
@@ -24,7 +50,7 @@ async def test_auth_components():
         # Test password hashing
         print("2. Testing password hashing...")
         test_password = "testpass123"
-        hashed = get_password_hash(test_password)
+        hashed = load_or_create_hash(test_password, fresh=fresh)
         print(f"   ✅ Password hashed: {hashed[:20]}...")
         
         # Test password verification
@@ -55,4 +81,6 @@ async def test_auth_components():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(test_auth_components())
\ No newline at end of file
+    from app.utils.loop import install_uvloop
+    install_uvloop()
+    asyncio.run(test_auth_components(fresh="--fresh" in sys.argv))
\ No newline at end of file
@@ -2,6 +2,9 @@
 Demonstration of the Mythweaver Rules Engine
 Shows example usage of all core functions
 """
+import sys
+from typing import List
+
 from app.services.rules_engine import (
     roll_d12,
     calculate_attribute_bonus,
@@ -16,17 +19,23 @@ from app.services.rules_engine import (
 )
 
 
+def emit(lines: List[str]):
+    """Write a block of demo output with a single stdout write"""
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def demo_dice_rolls():
     """Demonstrate dice rolling"""
-    print("=== Dice Rolling Demo ===")
+    lines = ["=== Dice Rolling Demo ==="]
     rolls = [roll_d12() for _ in range(5)]
-    print(f"5 d12 rolls: {rolls}")
-    print()
+    lines.append(f"5 d12 rolls: {rolls}")
+    lines.append("")
+    emit(lines)
 
 
 def demo_bonus_calculations():
     """Demonstrate attribute and skill bonus calculations"""
-    print("=== Bonus Calculations Demo ===")
+    lines = ["=== Bonus Calculations Demo ==="]
     
     might = 6
     blade_skill = 8
@@ -34,14 +43,15 @@ def demo_bonus_calculations():
     eab = calculate_attribute_bonus(might)
     sr = calculate_skill_rank(blade_skill)
     
-    print(f"Might {might} → EAB +{eab}")
-    print(f"Blade Skill {blade_skill} → Rank {sr}")
-    print()
+    lines.append(f"Might {might} → EAB +{eab}")
+    lines.append(f"Blade Skill {blade_skill} → Rank {sr}")
+    lines.append("")
+    emit(lines)
 
 
 def demo_check_resolution():
     """Demonstrate check resolution"""
-    print("=== Check Resolution Demo ===")
+    lines = ["=== Check Resolution Demo ==="]
     
     # Example: Character with Might 6, Blade 8 attacking (difficulty 11)
     result = perform_check(
@@ -52,14 +62,14 @@ def demo_check_resolution():
         situational_modifier=0
     )
     
-    print(f"Attack Check:")
-    print(f"  Dice Roll: {result.dice_rolls[0]}")
-    print(f"  + Might Bonus: +{result.attribute_bonus}")
-    print(f"  + Blade Rank: +{result.skill_rank}")
-    print(f"  = Total: {result.total} vs Difficulty {result.difficulty}")
-    print(f"  Margin: {result.margin:+d}")
-    print(f"  Outcome: {result.outcome.value.upper()}")
-    print()
+    lines.append(f"Attack Check:")
+    lines.append(f"  Dice Roll: {result.dice_rolls[0]}")
+    lines.append(f"  + Might Bonus: +{result.attribute_bonus}")
+    lines.append(f"  + Blade Rank: +{result.skill_rank}")
+    lines.append(f"  = Total: {result.total} vs Difficulty {result.difficulty}")
+    lines.append(f"  Margin: {result.margin:+d}")
+    lines.append(f"  Outcome: {result.outcome.value.upper()}")
+    lines.append("")
     
     # Example with advantage
     result_adv = perform_check(
@@ -69,16 +79,17 @@ def demo_check_resolution():
         edge=EdgeType.ADVANTAGE
     )
     
-    print(f"Stealth Check with Advantage:")
-    print(f"  Dice Rolls: {result_adv.dice_rolls} (kept {max(result_adv.dice_rolls)})")
-    print(f"  Total: {result_adv.total} vs Difficulty {result_adv.difficulty}")
-    print(f"  Outcome: {result_adv.outcome.value.upper()}")
-    print()
+    lines.append(f"Stealth Check with Advantage:")
+    lines.append(f"  Dice Rolls: {result_adv.dice_rolls} (kept {max(result_adv.dice_rolls)})")
+    lines.append(f"  Total: {result_adv.total} vs Difficulty {result_adv.difficulty}")
+    lines.append(f"  Outcome: {result_adv.outcome.value.upper()}")
+    lines.append("")
+    emit(lines)
 
 
 def demo_derived_stats():
     """Demonstrate derived stat calculations"""
-    print("=== Derived Stats Demo ===")
+    lines = ["=== Derived Stats Demo ==="]
     
     might = 6
     wits = 3
@@ -88,16 +99,17 @@ def demo_derived_stats():
     focus = calculate_max_focus(wits, presence)
     inventory = calculate_inventory_slots(might)
     
-    print(f"Character with Might {might}, Wits {wits}, Presence {presence}:")
-    print(f"  Max HP: {hp}")
-    print(f"  Max Focus: {focus}")
-    print(f"  Inventory Slots: {inventory}")
-    print()
+    lines.append(f"Character with Might {might}, Wits {wits}, Presence {presence}:")
+    lines.append(f"  Max HP: {hp}")
+    lines.append(f"  Max Focus: {focus}")
+    lines.append(f"  Inventory Slots: {inventory}")
+    lines.append("")
+    emit(lines)
 
 
 def demo_character_validation():
     """Demonstrate character validation"""
-    print("=== Character Validation Demo ===")
+    lines = ["=== Character Validation Demo ==="]
     
     # Valid character
     valid_attrs = {'might': 6, 'agility': 4, 'wits': 3, 'presence': 2}
@@ -113,67 +125,71 @@ def demo_character_validation():
     
     try:
         validate_character_creation(valid_attrs, valid_skills, valid_talents, 'blade')
-        print("✅ Valid character passed validation")
+        lines.append("✅ Valid character passed validation")
     except Exception as e:
-        print(f"❌ Validation failed: {e}")
+        lines.append(f"❌ Validation failed: {e}")
     
     # Invalid character (wrong attribute sum)
     invalid_attrs = {'might': 8, 'agility': 4, 'wits': 3, 'presence': 2}
     
     try:
         validate_character_creation(invalid_attrs, valid_skills, valid_talents, 'blade')
-        print("✅ Invalid character passed (shouldn't happen)")
+        lines.append("✅ Invalid character passed (shouldn't happen)")
     except Exception as e:
-        print(f"✅ Invalid character correctly rejected: {e}")
-    print()
+        lines.append(f"✅ Invalid character correctly rejected: {e}")
+    lines.append("")
+    emit(lines)
 
 
 def demo_combat_scenario():
     """Demonstrate a complete combat scenario"""
-    print("=== Combat Scenario Demo ===")
-    print("A Blade warrior faces a bandit guard...")
-    print()
+    lines = ["=== Combat Scenario Demo ==="]
+    lines.append("A Blade warrior faces a bandit guard...")
+    lines.append("")
     
     # Warrior stats
     might = 6  # EAB +3
     blade = 8  # Rank 2
     
-    print(f"Warrior: Might {might} (+{calculate_attribute_bonus(might)}), Blade {blade} (Rank {calculate_skill_rank(blade)})")
-    print()
+    lines.append(f"Warrior: Might {might} (+{calculate_attribute_bonus(might)}), Blade {blade} (Rank {calculate_skill_rank(blade)})")
+    lines.append("")
     
     # Round 1: Normal attack
-    print("Round 1: Warrior attacks (difficulty 11)")
+    lines.append("Round 1: Warrior attacks (difficulty 11)")
     result1 = perform_check(might, blade, 11)
-    print(f"  Roll: {result1.dice_rolls[0]} + {result1.attribute_bonus} + {result1.skill_rank} = {result1.total}")
-    print(f"  Result: {result1.outcome.value.upper()}")
+    lines.append(f"  Roll: {result1.dice_rolls[0]} + {result1.attribute_bonus} + {result1.skill_rank} = {result1.total}")
+    lines.append(f"  Result: {result1.outcome.value.upper()}")
     
     if result1.outcome in [Outcome.SUCCESS, Outcome.STRONG_SUCCESS]:
         damage = 6 + calculate_attribute_bonus(might)
-        print(f"  ⚔️ Hit! Damage: {damage}")
+        lines.append(f"  ⚔️ Hit! Damage: {damage}")
     else:
-        print(f"  ❌ Miss!")
-    print()
+        lines.append(f"  ❌ Miss!")
+    lines.append("")
     
     # Round 2: Attack with advantage (flanking)
-    print("Round 2: Warrior attacks with ally flanking (advantage)")
+    lines.append("Round 2: Warrior attacks with ally flanking (advantage)")
     result2 = perform_check(might, blade, 11, EdgeType.ADVANTAGE)
-    print(f"  Rolls: {result2.dice_rolls} → kept {max(result2.dice_rolls)}")
-    print(f"  Total: {result2.total} vs {result2.difficulty}")
-    print(f"  Result: {result2.outcome.value.upper()}")
+    lines.append(f"  Rolls: {result2.dice_rolls} → kept {max(result2.dice_rolls)}")
+    lines.append(f"  Total: {result2.total} vs {result2.difficulty}")
+    lines.append(f"  Result: {result2.outcome.value.upper()}")
     
     if result2.outcome in [Outcome.SUCCESS, Outcome.STRONG_SUCCESS]:
         damage = 6 + calculate_attribute_bonus(might)
         if result2.outcome == Outcome.STRONG_SUCCESS:
             damage += 3  # Bonus damage on strong success
-        print(f"  ⚔️ Hit! Damage: {damage}")
-    print()
+        lines.append(f"  ⚔️ Hit! Damage: {damage}")
+    lines.append("")
+    emit(lines)
 
 
 if __name__ == "__main__":
-    print("╔═══════════════════════════════════════╗")
-    print("║   Mythweaver Rules Engine Demo       ║")
-    print("╚═══════════════════════════════════════╝")
-    print()
+    emit([
+        "╔═══════════════════════════════════════╗",
+        "║   Mythweaver Rules Engine Demo       ║",
+        "╚═══════════════════════════════════════╝",
+        "",
+    ])
     
     demo_dice_rolls()
     demo_bonus_calculations()
@@ -182,6 +198,8 @@ if __name__ == "__main__":
     demo_character_validation()
     demo_combat_scenario()
     
-    print("=" * 50)
-    print("✅ All rules engine functions demonstrated!")
-    print("=" * 50)
+    emit([
+        "=" * 50,
+        "✅ All rules engine functions demonstrated!",
+        "=" * 50,
+    ])
@@ -50,5 +50,7 @@ async def main():
 
 
 if __name__ == "__main__":
+    from app.utils.loop import install_uvloop
+    install_uvloop()
     exit_code = asyncio.run(main())
     sys.exit(exit_code)
\ No newline at end of file
@@ -4,9 +4,12 @@ AI Narrator RPG Backend
 """
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from datetime import datetime
-import uvicorn
+from fastapi.responses import ORJSONResponse
+from datetime import datetime, timezone
+import asyncio
+import time
 from contextlib import asynccontextmanager
+from sqlalchemy import text
 
 from app.core.config import settings
 from app.core.database import engine
@@ -14,19 +17,61 @@ from app.models import Base
 from app.routers import auth, narrator, campaign
 from app.middleware.error_handler import setup_error_handlers
 
+# Seconds a database check result is reused by /health before pinging again
+DB_HEALTH_TTL = 5.0
+
+# Health probe state; checked_at 0 means the database hasn't been checked yet
+_HEALTH_TS_CACHE = {"t": 0.0, "s": ""}
+_DB_HEALTH = {"ok": False, "error": None, "checked_at": 0.0}
+_DB_HEALTH_LOCK = asyncio.Lock()
+
+
+def _record_db_health(ok: bool, error=None):
+    """Store the outcome of a database check and when it happened"""
+    _DB_HEALTH["ok"] = ok
+    _DB_HEALTH["error"] = error
+    _DB_HEALTH["checked_at"] = time.monotonic()
+
+
+async def _ping_database():
+    """Run a single connectivity check and record the result"""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        _record_db_health(True)
+    except Exception as e:
+        _record_db_health(False, str(e))
+
+
+async def _check_database():
+    """Ping the database on demand, reusing a result younger than DB_HEALTH_TTL"""
+    if time.monotonic() - _DB_HEALTH["checked_at"] < DB_HEALTH_TTL:
+        return
+    async with _DB_HEALTH_LOCK:
+        # Concurrent probes wait for the one ping already in flight
+        if time.monotonic() - _DB_HEALTH["checked_at"] >= DB_HEALTH_TTL:
+            await _ping_database()
+
+
+def _health_timestamp() -> str:
+    """ISO timestamp for /health, reformatted at most once per second"""
+    now = time.time()
+    cached = _HEALTH_TS_CACHE
+    if now - cached["t"] > 1.0:
+        cached["s"] = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        cached["t"] = now
+    return cached["s"]
+
+
 # Database initialization
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan: startup and shutdown events"""
-    # Startup: Create database tables
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
-    
-    # Test database connection
+    # Startup: Create database tables (running the DDL also proves connectivity)
     try:
-        from sqlalchemy import text
         async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
+            await conn.run_sync(Base.metadata.create_all)
+        _record_db_health(True)
         print("✅ Database connection successful")
     except Exception as e:
         print(f"❌ Database connection error: {e}")
@@ -44,7 +89,9 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description="AI-powered narrator for interactive RPG storytelling",
-    lifespan=lifespan
+    lifespan=lifespan,
+    # Campaign responses carry long narration text; orjson encodes it in C
+    default_response_class=ORJSONResponse,
 )
 
 # Setup error handlers for standardized exception handling
@@ -52,44 +99,48 @@ setup_error_handlers(app)
 
 # CORS middleware - configured for mobile app development
 # In development, allow all localhost origins for Flutter web
+# Lists are built once here; production uses explicit values so
+# preflight checks are plain membership tests instead of wildcards
 if settings.DEBUG:
     allowed_origins = ["*"]  # Allow all origins in development
+    allowed_methods = ["*"]
+    allowed_headers = ["*"]
 else:
-    allowed_origins = settings.ALLOWED_ORIGINS.split(",")
+    allowed_origins = [
+        origin.strip() for origin in settings.ALLOWED_ORIGINS.split(",") if origin.strip()
+    ]
+    allowed_methods = ["GET", "POST", "PUT", "DELETE", "OPTIONS"]
+    allowed_headers = ["Authorization", "Content-Type", "Accept"]
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=allowed_origins,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=allowed_methods,
+    allow_headers=allowed_headers,
 )
 
 # Health check endpoint
 @app.get("/health")
 async def health_check():
-    """Health check endpoint"""
-    try:
-        # Test database connection
-        from sqlalchemy import text
-        async with engine.begin() as conn:
-            await conn.execute(text("SELECT 1"))
-        
-        # Check if OpenAI API key is configured
-        openai_configured = settings.OPENAI_API_KEY is not None
-        
-        return {
-            "status": "healthy",
-            "version": settings.APP_VERSION,
-            "timestamp": datetime.utcnow().isoformat(),
-            "database": "connected",
-            "openai_configured": openai_configured
-        }
-    except Exception as e:
+    """Health check endpoint (database state is cached for DB_HEALTH_TTL seconds)"""
+    await _check_database()
+    if not _DB_HEALTH["ok"]:
         raise HTTPException(
             status_code=503, 
-            detail=f"Service unhealthy: {str(e)}"
+            detail=f"Service unhealthy: {_DB_HEALTH['error']}"
         )
+    
+    # Check if OpenAI API key is configured
+    openai_configured = settings.OPENAI_API_KEY is not None
+    
+    return {
+        "status": "healthy",
+        "version": settings.APP_VERSION,
+        "timestamp": _health_timestamp(),
+        "database": "connected",
+        "openai_configured": openai_configured
+    }
 
 
 # API routers
@@ -110,6 +161,8 @@ async def root():
 
 
 if __name__ == "__main__":
+    import uvicorn
+    
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
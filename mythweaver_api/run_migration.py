@@ -2,16 +2,17 @@
 """
 Run SQL migration against Supabase database
 """
+import asyncio
 import os
 import sys
 from pathlib import Path
-import psycopg2
+import asyncpg
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-def run_migration(migration_file: str):
+async def run_migration(migration_file: str):
     """Run a SQL migration file against the database"""
     
     # Get database URL from environment
@@ -30,21 +31,19 @@ def run_migration(migration_file: str):
     sql = migration_path.read_text()
     
     # Connect to database and run migration
+    conn = None
     try:
         print(f"🔌 Connecting to database...")
-        conn = psycopg2.connect(database_url)
-        conn.autocommit = False
-        cursor = conn.cursor()
+        conn = await asyncpg.connect(database_url)
         
+        # Run the whole migration in one transaction (rolled back on error)
         print(f"🚀 Running migration: {migration_path.name}")
-        cursor.execute(sql)
-        
-        # Commit the transaction
-        conn.commit()
+        async with conn.transaction():
+            await conn.execute(sql)
         print(f"✅ Migration completed successfully!")
         
         # Verify profiles table was created
-        cursor.execute("""
+        columns = await conn.fetch("""
             SELECT table_name, column_name, data_type 
             FROM information_schema.columns 
             WHERE table_schema = 'public' 
@@ -52,24 +51,20 @@ def run_migration(migration_file: str):
             ORDER BY ordinal_position;
         """)
         
-        columns = cursor.fetchall()
         if columns:
             print(f"\n📊 Profiles table structure:")
             for table, column, dtype in columns:
                 print(f"   - {column}: {dtype}")
         
-        cursor.close()
-        conn.close()
-        
-    except psycopg2.Error as e:
+    except asyncpg.PostgresError as e:
         print(f"❌ Migration failed: {e}")
-        if conn:
-            conn.rollback()
-            conn.close()
         sys.exit(1)
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         sys.exit(1)
+    finally:
+        if conn:
+            await conn.close()
 
 if __name__ == "__main__":
     migration_file = "migrations/001_initial_schema.sql"
@@ -77,4 +72,7 @@ if __name__ == "__main__":
     if len(sys.argv) > 1:
         migration_file = sys.argv[1]
     
-    run_migration(migration_file)
+    from app.utils.loop import install_uvloop
+    install_uvloop()
+    
+    asyncio.run(run_migration(migration_file))
@@ -5,6 +5,8 @@ Run this with the server running to test the complete flow.
 import httpx
 import asyncio
 import json
+import secrets
+import sys
 
 
 BASE_URL = "http://localhost:8000"
@@ -17,9 +19,8 @@ async def test_campaign_creation():
         print("Campaign Creation Flow Test")
         print("=" * 60)
         
-        # Use a unique email for each test run
-        import time
-        unique_id = int(time.time())
+        # Use a unique email for each test run, even runs started in the same second
+        unique_id = secrets.token_hex(4)
         
         # Step 1: Register
         print("\n1. Registering new user...")
@@ -89,15 +90,19 @@ async def test_campaign_creation():
             print("✅ Campaign created successfully")
             campaign_data = create_response.json()
             
-            print(f"\nCampaign ID: {campaign_data['campaign_id']}")
-            print(f"Character ID: {campaign_data['character_id']}")
-            print(f"\nOpening Narration ({len(campaign_data['opening_narration'])} chars):")
-            print("-" * 60)
-            print(campaign_data['opening_narration'])
-            print("-" * 60)
-            print(f"\nSuggested Actions ({len(campaign_data['suggested_actions'])} actions):")
-            for i, action in enumerate(campaign_data['suggested_actions'], 1):
-                print(f"{i}. {action}")
+            report = [
+                f"\nCampaign ID: {campaign_data['campaign_id']}",
+                f"Character ID: {campaign_data['character_id']}",
+                f"\nOpening Narration ({len(campaign_data['opening_narration'])} chars):",
+                "-" * 60,
+                campaign_data['opening_narration'],
+                "-" * 60,
+                f"\nSuggested Actions ({len(campaign_data['suggested_actions'])} actions):",
+            ]
+            report.extend(
+                f"{i}. {action}" for i, action in enumerate(campaign_data['suggested_actions'], 1)
+            )
+            sys.stdout.write("\n".join(report) + "\n")
             
             campaign_id = campaign_data['campaign_id']
             
@@ -112,24 +117,28 @@ async def test_campaign_creation():
                 print("✅ Campaign retrieved successfully")
                 retrieved = get_response.json()
                 
-                print(f"\nCampaign Details:")
-                print(f"  Name: {retrieved['name']}")
-                print(f"  Template: {retrieved['template_id']}")
-                print(f"  Scene: {retrieved['current_scene_number']}")
-                print(f"  Chapter: {retrieved['chapter_number']}")
-                print(f"  Tone: {retrieved['tone']}")
-                print(f"  Difficulty: {retrieved['difficulty']}")
+                sys.stdout.write(
+                    f"\nCampaign Details:\n"
+                    f"  Name: {retrieved['name']}\n"
+                    f"  Template: {retrieved['template_id']}\n"
+                    f"  Scene: {retrieved['current_scene_number']}\n"
+                    f"  Chapter: {retrieved['chapter_number']}\n"
+                    f"  Tone: {retrieved['tone']}\n"
+                    f"  Difficulty: {retrieved['difficulty']}\n"
+                )
                 
                 if retrieved.get('character'):
                     char = retrieved['character']
-                    print(f"\nCharacter Details:")
-                    print(f"  Name: {char['name']}")
-                    print(f"  Origin: {char['origin_id']}")
-                    print(f"  Path: {char['path_id']}")
-                    print(f"  Attributes: M{char['might_score']} A{char['agility_score']} W{char['wits_score']} P{char['presence_score']}")
-                    print(f"  HP: {char['current_hp']}/{char['max_hp']}")
-                    print(f"  Focus: {char['current_focus']}/{char['max_focus']}")
-                    print(f"  Supplies: {char['supplies']}")
+                    sys.stdout.write(
+                        f"\nCharacter Details:\n"
+                        f"  Name: {char['name']}\n"
+                        f"  Origin: {char['origin_id']}\n"
+                        f"  Path: {char['path_id']}\n"
+                        f"  Attributes: M{char['might_score']} A{char['agility_score']} W{char['wits_score']} P{char['presence_score']}\n"
+                        f"  HP: {char['current_hp']}/{char['max_hp']}\n"
+                        f"  Focus: {char['current_focus']}/{char['max_focus']}\n"
+                        f"  Supplies: {char['supplies']}\n"
+                    )
                     
                     # Verify derived stats
                     expected_hp = 8 + (char['might_score'] * 2)  # 8 + (3 * 2) = 14
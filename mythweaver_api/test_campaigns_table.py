@@ -2,21 +2,15 @@
 """
 Test campaigns table RLS (Row Level Security) policies
 """
-import os
 import sys
 from uuid import uuid4
-import psycopg2
-from dotenv import load_dotenv
 
-load_dotenv()
+import pytest
 
-def test_campaigns_rls():
+
+def test_campaigns_rls(database_url):
     """Test that RLS policies prevent unauthorized access"""
-    
-    database_url = os.getenv('DATABASE_URL')
-    if not database_url:
-        print("❌ DATABASE_URL not found in .env file")
-        sys.exit(1)
+    import psycopg2
     
     try:
         print("🔌 Connecting to database...")
@@ -51,11 +45,12 @@ def test_campaigns_rls():
         """)
         
         columns = cursor.fetchall()
-        print(f"   📊 Found {len(columns)} columns:")
+        report = [f"   📊 Found {len(columns)} columns:"]
         for col_name, data_type, nullable, default in columns:
             null_str = "NULL" if nullable == "YES" else "NOT NULL"
             default_str = f" DEFAULT {default}" if default else ""
-            print(f"      - {col_name}: {data_type} {null_str}{default_str}")
+            report.append(f"      - {col_name}: {data_type} {null_str}{default_str}")
+        sys.stdout.write("\n".join(report) + "\n")
         
         # Check RLS is enabled
         print("\n3️⃣ Checking Row Level Security...")
@@ -81,9 +76,9 @@ def test_campaigns_rls():
         
         policies = cursor.fetchall()
         if policies:
-            print(f"   ✅ Found {len(policies)} RLS policies:")
-            for policy_name, cmd, qual, with_check in policies:
-                print(f"      - {policy_name} ({cmd})")
+            report = [f"   ✅ Found {len(policies)} RLS policies:"]
+            report.extend(f"      - {policy_name} ({cmd})" for policy_name, cmd, qual, with_check in policies)
+            sys.stdout.write("\n".join(report) + "\n")
         else:
             print(f"   ⚠️  No RLS policies found")
         
@@ -98,9 +93,9 @@ def test_campaigns_rls():
         
         indexes = cursor.fetchall()
         if indexes:
-            print(f"   ✅ Found {len(indexes)} indexes:")
-            for idx_name, idx_def in indexes:
-                print(f"      - {idx_name}")
+            report = [f"   ✅ Found {len(indexes)} indexes:"]
+            report.extend(f"      - {idx_name}" for idx_name, idx_def in indexes)
+            sys.stdout.write("\n".join(report) + "\n")
         else:
             print(f"   ⚠️  No indexes found")
         
@@ -158,4 +153,5 @@ def test_campaigns_rls():
         sys.exit(1)
 
 if __name__ == "__main__":
-    test_campaigns_rls()
+    # Run through pytest so the root conftest loads .env and provides database_url
+    sys.exit(pytest.main([__file__, "-s"]))
@@ -26,4 +26,6 @@ async def check_table():
 
 
 if __name__ == "__main__":
+    from app.utils.loop import install_uvloop
+    install_uvloop()
     asyncio.run(check_table())
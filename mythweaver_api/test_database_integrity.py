@@ -3,48 +3,84 @@
 Comprehensive database integration tests
 Tests triggers, RLS policies, and data integrity
 """
-import os
 import sys
 from uuid import uuid4
-import psycopg2
-from dotenv import load_dotenv
-import time
+import pytest
 
-load_dotenv()
 
-def test_database_integrity():
+@pytest.mark.xdist_group("write")
+def test_database_integrity(db_conn):
     """Test database schema, triggers, and RLS policies"""
+    import psycopg2
+    from psycopg2.extras import execute_values, register_uuid
     
-    database_url = os.getenv('DATABASE_URL')
-    if not database_url:
-        print("❌ DATABASE_URL not found")
-        sys.exit(1)
+    # Bind uuid.UUID parameters directly and read uuid columns back as UUID objects
+    register_uuid()
     
+    conn = db_conn
     try:
-        conn = psycopg2.connect(database_url)
+        # The trigger checks rely on explicit commits/rollbacks
         conn.autocommit = False
         cursor = conn.cursor()
         
         print("🧪 Running Database Integration Tests\n")
         
+        # Fetch all catalog facts checked below (indexes, RLS policies) in one round-trip
+        cursor.execute("""
+            WITH idx AS (
+                SELECT indexname FROM pg_indexes
+                WHERE schemaname = 'public'
+                AND tablename IN ('profiles', 'mythweaver_campaigns')
+            ), pol AS (
+                SELECT policyname FROM pg_policies
+                WHERE tablename = 'mythweaver_campaigns'
+            )
+            SELECT json_build_object(
+                'indexes', COALESCE((SELECT json_agg(indexname ORDER BY indexname) FROM idx), '[]'::json),
+                'policies', COALESCE((SELECT json_agg(policyname) FROM pol), '[]'::json)
+            );
+        """)
+        schema = cursor.fetchone()[0]
+        
+        # The timestamp checks run the same select/update pairs, so parse and
+        # plan them once per session. PREPARE is not transactional: the
+        # statements survive the commits/rollbacks below until DEALLOCATE.
+        cursor.execute("""
+            PREPARE sel_profile_ts(uuid) AS
+                SELECT updated_at FROM public.profiles WHERE id = $1;
+            PREPARE upd_profile_username(uuid, text) AS
+                UPDATE public.profiles SET username = $2
+                WHERE id = $1 RETURNING updated_at;
+            PREPARE sel_campaign_ts(uuid) AS
+                SELECT updated_at FROM public.mythweaver_campaigns WHERE id = $1;
+            PREPARE upd_campaign_scene(uuid, int) AS
+                UPDATE public.mythweaver_campaigns SET current_scene_number = $2
+                WHERE id = $1 RETURNING updated_at;
+        """)
+        
         # Test 1: Profile auto-creation trigger
         print("1️⃣ Testing profile auto-creation trigger...")
         test_user_id = uuid4()
         test_email = f"test-{uuid4()}@example.com"
+        # Second user is used by the RLS/cascade tests below
+        test_user2_id = uuid4()
+        test_email2 = f"test2-{uuid4()}@example.com"
         
-        # Insert into auth.users
-        cursor.execute("""
+        # Insert both users into auth.users in one statement
+        execute_values(cursor, """
             INSERT INTO auth.users (id, email, raw_user_meta_data)
-            VALUES (%s, %s, %s)
-            RETURNING id;
-        """, (str(test_user_id), test_email, '{"full_name": "Test User"}'))
+            VALUES %s;
+        """, [
+            (test_user_id, test_email, '{"full_name": "Test User"}'),
+            (test_user2_id, test_email2, None),
+        ])
         
         # Check if profile was auto-created
         cursor.execute("""
             SELECT id, email, full_name, storyfire_balance, is_premium
             FROM public.profiles
             WHERE id = %s;
-        """, (str(test_user_id),))
+        """, (test_user_id,))
         
         profile = cursor.fetchone()
         if profile:
@@ -59,26 +95,20 @@ def test_database_integrity():
                 print("   ❌ Default Storyfire values incorrect")
         else:
             print("   ❌ Profile was NOT auto-created")
-            conn.rollback()
-            return False
+            pytest.fail("Profile was NOT auto-created")
         
         # Test 2: Updated_at trigger
         print("\n2️⃣ Testing updated_at trigger...")
-        cursor.execute("""
-            SELECT updated_at FROM public.profiles WHERE id = %s;
-        """, (str(test_user_id),))
+        cursor.execute("EXECUTE sel_profile_ts(%s);", (test_user_id,))
         original_updated_at = cursor.fetchone()[0]
         
+        # NOW() is the transaction start time, so a short server-side sleep
+        # before committing guarantees the next transaction gets a later stamp
+        cursor.execute("SELECT pg_sleep(0.01);")
         conn.commit()  # Commit to finalize the initial timestamp
-        time.sleep(1)  # Wait 1 second to ensure timestamp difference
         
         # Update profile
-        cursor.execute("""
-            UPDATE public.profiles 
-            SET username = 'testuser' 
-            WHERE id = %s
-            RETURNING updated_at;
-        """, (str(test_user_id),))
+        cursor.execute("EXECUTE upd_profile_username(%s, %s);", (test_user_id, 'testuser'))
         
         new_updated_at = cursor.fetchone()[0]
         conn.commit()
@@ -91,15 +121,20 @@ def test_database_integrity():
         # Test 3: Campaign creation and FK constraint
         print("\n3️⃣ Testing campaign creation and foreign key...")
         test_campaign_id = uuid4()
+        test_campaign2_id = uuid4()
         
-        cursor.execute("""
+        # Create both users' campaigns in one statement
+        created = execute_values(cursor, """
             INSERT INTO public.mythweaver_campaigns 
             (id, user_id, name, template_id)
-            VALUES (%s, %s, 'Test Campaign FK', 'broken_kingdom')
-            RETURNING id, name, current_scene_number;
-        """, (str(test_campaign_id), str(test_user_id)))
-        
-        campaign = cursor.fetchone()
+            VALUES %s
+            RETURNING id, name, current_scene_number, content_limits::text;
+        """, [
+            (test_campaign_id, test_user_id, 'Test Campaign FK', 'broken_kingdom'),
+            (test_campaign2_id, test_user2_id, 'User2 Campaign', 'broken_kingdom'),
+        ], fetch=True)
+        
+        campaign = next((row for row in created if row[0] == test_campaign_id), None)
         if campaign:
             print(f"   ✅ Campaign created: {campaign[1]}")
             print(f"      - Scene number: {campaign[2]} (expected: 1)")
@@ -108,20 +143,13 @@ def test_database_integrity():
         
         # Test 4: Campaign updated_at trigger
         print("\n4️⃣ Testing campaign updated_at trigger...")
-        cursor.execute("""
-            SELECT updated_at FROM public.mythweaver_campaigns WHERE id = %s;
-        """, (str(test_campaign_id),))
+        cursor.execute("EXECUTE sel_campaign_ts(%s);", (test_campaign_id,))
         original_camp_updated = cursor.fetchone()[0]
         
+        cursor.execute("SELECT pg_sleep(0.01);")
         conn.commit()  # Commit to finalize timestamp
-        time.sleep(1)
         
-        cursor.execute("""
-            UPDATE public.mythweaver_campaigns 
-            SET current_scene_number = 2
-            WHERE id = %s
-            RETURNING updated_at;
-        """, (str(test_campaign_id),))
+        cursor.execute("EXECUTE upd_campaign_scene(%s, %s);", (test_campaign_id, 2))
         
         new_camp_updated = cursor.fetchone()[0]
         conn.commit()
@@ -133,50 +161,27 @@ def test_database_integrity():
         
         # Test 5: RLS isolation (create second user and verify cross-access blocked)
         print("\n5️⃣ Testing Row Level Security isolation...")
-        test_user2_id = uuid4()
-        test_email2 = f"test2-{uuid4()}@example.com"
-        
-        cursor.execute("""
-            INSERT INTO auth.users (id, email)
-            VALUES (%s, %s);
-        """, (str(test_user2_id), test_email2))
-        
-        test_campaign2_id = uuid4()
-        cursor.execute("""
-            INSERT INTO public.mythweaver_campaigns 
-            (id, user_id, name)
-            VALUES (%s, %s, 'User2 Campaign')
-            RETURNING id;
-        """, (str(test_campaign2_id), str(test_user2_id)))
-        
-        print(f"   ✅ Created second user and campaign")
+        print(f"   ✅ Second user and campaign created during setup")
         
         # Note: RLS is enforced at the application level with SET LOCAL role
         # In direct superuser connection, RLS is bypassed
         # We'll verify the policy exists instead
-        cursor.execute("""
-            SELECT policyname, cmd 
-            FROM pg_policies 
-            WHERE tablename = 'mythweaver_campaigns'
-            AND policyname = 'Users can only access their own campaigns';
-        """)
-        
-        policy = cursor.fetchone()
-        if policy:
-            print(f"   ✅ RLS policy exists: {policy[0]}")
+        policy_name = 'Users can only access their own campaigns'
+        if policy_name in schema['policies']:
+            print(f"   ✅ RLS policy exists: {policy_name}")
             print(f"      (Note: Policy enforced for non-superuser connections)")
         else:
             print(f"   ❌ RLS policy NOT found")
         
         # Test 6: Cascade delete (delete user, verify campaign deleted)
         print("\n6️⃣ Testing cascade delete...")
+        # Both statements go in one round-trip. They must stay separate statements:
+        # a DELETE inside a WITH clause would cascade only after the outer SELECT's
+        # snapshot was taken, so the campaign would still appear to exist.
         cursor.execute("""
             DELETE FROM auth.users WHERE id = %s;
-        """, (str(test_user2_id),))
-        
-        cursor.execute("""
             SELECT id FROM public.mythweaver_campaigns WHERE id = %s;
-        """, (str(test_campaign2_id),))
+        """, (test_user2_id, test_campaign2_id))
         
         deleted_campaign = cursor.fetchone()
         if not deleted_campaign:
@@ -186,15 +191,7 @@ def test_database_integrity():
         
         # Test 7: Check indexes exist
         print("\n7️⃣ Testing indexes...")
-        cursor.execute("""
-            SELECT schemaname, tablename, indexname
-            FROM pg_indexes
-            WHERE schemaname = 'public'
-            AND tablename IN ('profiles', 'mythweaver_campaigns')
-            ORDER BY tablename, indexname;
-        """)
-        
-        indexes = cursor.fetchall()
+        found_indexes = schema['indexes']
         expected_indexes = [
             'profiles_email_idx',
             'profiles_username_idx',
@@ -203,8 +200,7 @@ def test_database_integrity():
             'campaigns_template_id_idx'
         ]
         
-        found_indexes = [idx[2] for idx in indexes]
-        print(f"   Found {len(indexes)} indexes:")
+        print(f"   Found {len(found_indexes)} indexes:")
         
         for expected in expected_indexes:
             if expected in found_indexes:
@@ -215,14 +211,8 @@ def test_database_integrity():
         # Test 8: Check data types and constraints
         print("\n8️⃣ Testing data constraints...")
         
-        # Test JSONB default values
-        cursor.execute("""
-            SELECT content_limits::text 
-            FROM public.mythweaver_campaigns 
-            WHERE id = %s;
-        """, (str(test_campaign_id),))
-        
-        content_limits = cursor.fetchone()[0]
+        # Test JSONB default values (returned when the campaign was inserted)
+        content_limits = campaign[3]
         if content_limits == '{}':
             print(f"   ✅ JSONB default value working (content_limits = {{}})")
         else:
@@ -233,7 +223,7 @@ def test_database_integrity():
             cursor.execute("""
                 INSERT INTO public.mythweaver_campaigns (user_id)
                 VALUES (%s);
-            """, (str(test_user_id),))
+            """, (test_user_id,))
             print(f"   ❌ NOT NULL constraint not working (name should be required)")
             conn.rollback()
         except psycopg2.IntegrityError:
@@ -242,30 +232,33 @@ def test_database_integrity():
         
         # Cleanup test data
         print("\n🧹 Cleaning up test data...")
-        cursor.execute("DELETE FROM public.mythweaver_campaigns WHERE id = %s;", (str(test_campaign_id),))
-        cursor.execute("DELETE FROM auth.users WHERE id = %s;", (str(test_user_id),))
+        # The cascade-delete check above was rolled back, so both users remain
+        cursor.execute(
+            "DELETE FROM public.mythweaver_campaigns WHERE id = ANY(%s);",
+            ([test_campaign_id, test_campaign2_id],)
+        )
+        cursor.execute(
+            "DELETE FROM auth.users WHERE id = ANY(%s);",
+            ([test_user_id, test_user2_id],)
+        )
         conn.commit()
         print("   ✅ Test data cleaned up")
         
         cursor.close()
-        conn.close()
         
         print("\n🎉 All database integration tests passed!")
-        return True
         
     except psycopg2.Error as e:
         print(f"\n❌ Database error: {e}")
-        if conn:
-            conn.rollback()
-            conn.close()
-        return False
-    except Exception as e:
-        print(f"\n❌ Unexpected error: {e}")
-        if conn:
-            conn.rollback()
-            conn.close()
-        return False
+        pytest.fail(f"Database error: {e}")
+    finally:
+        # Hand the shared connection back in the read-only probes' autocommit mode
+        conn.rollback()
+        conn.autocommit = True
+        # Drop the prepared statements on every exit path, so the next run on
+        # this pooled connection can PREPARE them again
+        with conn.cursor() as cleanup:
+            cleanup.execute("DEALLOCATE ALL;")
 
 if __name__ == "__main__":
-    success = test_database_integrity()
-    sys.exit(0 if success else 1)
+    sys.exit(pytest.main([__file__, "-s"]))
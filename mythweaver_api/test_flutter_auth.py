@@ -2,19 +2,31 @@
 Test Flutter Auth Service Integration
 This script tests the auth service by making test calls to the backend
 """
-import requests
-import json
-import random
-import string
+import secrets
 
 BASE_URL = "http://localhost:8000"
 
+# One keep-alive session for the whole run, created on first use so that
+# importing this module doesn't import requests
+SESSION = None
+
+def get_session():
+    """Return the module's shared requests.Session, creating it on first call"""
+    global SESSION
+    if SESSION is None:
+        import requests
+        SESSION = requests.Session()
+        SESSION.headers.update({"Content-Type": "application/json"})
+    return SESSION
+
 def generate_test_username():
     """Generate random username for testing"""
-    return f"fluttertest_{''.join(random.choices(string.ascii_lowercase, k=6))}"
+    return f"fluttertest_{secrets.token_hex(3)}"
 
 def test_flutter_auth_flow():
     """Test the complete auth flow that Flutter will use"""
+    session = get_session()
+    
     print("=" * 60)
     print("🧪 Flutter Auth Service Integration Test")
     print("=" * 60)
@@ -29,20 +41,25 @@ def test_flutter_auth_flow():
     print(f"   Email: {email}")
     print(f"   Password: {password}")
     
-    # Test 1: Register
-    print("\n1️⃣ Testing Registration...")
-    register_data = {
+    # Build the credential payloads once; each request reuses the same dicts
+    login_data = {
         "username": username,
-        "email": email,
         "password": password
     }
+    register_data = {**login_data, "email": email}
+    invalid_login = {**login_data, "password": "wrongpassword"}
+    
+    # Test 1: Register
+    print("\n1️⃣ Testing Registration...")
     
-    response = requests.post(f"{BASE_URL}/auth/register", json=register_data)
+    response = session.post(f"{BASE_URL}/auth/register", json=register_data)
     print(f"   Status: {response.status_code}")
     
     if response.status_code == 200:
         auth_response = response.json()
         token = auth_response.get('accessToken')
+        # Every later request on the session is authenticated
+        session.headers["Authorization"] = f"Bearer {token}"
         print(f"   ✅ Registration successful!")
         print(f"   Token: {token[:30]}...")
     else:
@@ -51,12 +68,7 @@ def test_flutter_auth_flow():
     
     # Test 2: Login with same credentials
     print("\n2️⃣ Testing Login...")
-    login_data = {
-        "username": username,
-        "password": password
-    }
-    
-    response = requests.post(f"{BASE_URL}/auth/login", json=login_data)
+    response = session.post(f"{BASE_URL}/auth/login", json=login_data)
     print(f"   Status: {response.status_code}")
     
     if response.status_code == 200:
@@ -76,12 +88,7 @@ def test_flutter_auth_flow():
     
     # Test 4: Test with invalid credentials
     print("\n3️⃣ Testing Invalid Login...")
-    invalid_login = {
-        "username": username,
-        "password": "wrongpassword"
-    }
-    
-    response = requests.post(f"{BASE_URL}/auth/login", json=invalid_login)
+    response = session.post(f"{BASE_URL}/auth/login", json=invalid_login)
     print(f"   Status: {response.status_code}")
     
     if response.status_code == 401:
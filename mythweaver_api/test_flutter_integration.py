@@ -3,21 +3,28 @@ Test Script: Flutter Auth Integration Test
 Tests complete auth flow including authenticated requests.
 """
 
-import requests
-import json
-import random
-import string
+import asyncio
+import httpx
+import secrets
 
 BASE_URL = "http://localhost:8000"
 
-def random_username():
+def random_username(prefix="testuser"):
     """Generate random username"""
-    suffix = ''.join(random.choices(string.ascii_lowercase, k=6))
-    return f"testuser_{suffix}"
+    return f"{prefix}_{secrets.token_hex(4)}"
 
 def test_flutter_auth_integration():
     """Test complete authentication flow as Flutter app would use it"""
-    
+    return asyncio.run(run_auth_integration())
+
+
+async def run_auth_integration():
+    """Auth flow over one pooled client; independent /narrator/me probes run concurrently"""
+    async with httpx.AsyncClient(base_url=BASE_URL) as client:
+        return await _auth_integration_flow(client)
+
+
+async def _auth_integration_flow(client: httpx.AsyncClient):
     print("=" * 70)
     print("FLUTTER AUTH INTEGRATION TEST")
     print("=" * 70)
@@ -32,15 +39,17 @@ def test_flutter_auth_integration():
     print(f"   Email: {email}")
     print(f"   Password: {password}")
     
+    # Login reuses the registration credentials, so build that payload once
+    credentials = {
+        "username": username,
+        "password": password
+    }
+    
     # Test 1: Register new account
     print("\n1️⃣  Testing Registration...")
-    register_response = requests.post(
-        f"{BASE_URL}/auth/register",
-        json={
-            "username": username,
-            "email": email,
-            "password": password
-        }
+    register_response = await client.post(
+        "/auth/register",
+        json={**credentials, "email": email}
     )
     
     print(f"   Status: {register_response.status_code}")
@@ -59,12 +68,9 @@ def test_flutter_auth_integration():
     
     # Test 2: Login with same credentials
     print("\n2️⃣  Testing Login...")
-    login_response = requests.post(
-        f"{BASE_URL}/auth/login",
-        json={  # Use JSON, not form data
-            "username": username,
-            "password": password
-        }
+    login_response = await client.post(
+        "/auth/login",
+        json=credentials  # Use JSON, not form data
     )
     
     print(f"   Status: {login_response.status_code}")
@@ -80,12 +86,15 @@ def test_flutter_auth_integration():
     # Update token with login token
     token = login_data.get('accessToken')
     
-    # Test 3: Make authenticated request WITHOUT token
-    print("\n3️⃣  Testing Authenticated Request (No Token - Should Fail)...")
-    unauth_response = requests.get(
-        f"{BASE_URL}/narrator/me"
+    # Tests 3, 4 and 6 only need the token, so issue the three probes together
+    unauth_response, auth_response, invalid_response = await asyncio.gather(
+        client.get("/narrator/me"),
+        client.get("/narrator/me", headers={"Authorization": f"Bearer {token}"}),
+        client.get("/narrator/me", headers={"Authorization": "Bearer invalid_token_12345"}),
     )
     
+    # Test 3: Make authenticated request WITHOUT token
+    print("\n3️⃣  Testing Authenticated Request (No Token - Should Fail)...")
     print(f"   Status: {unauth_response.status_code}")
     if unauth_response.status_code in [401, 403]:
         print(f"   ✅ Correctly rejected unauthenticated request")
@@ -94,13 +103,6 @@ def test_flutter_auth_integration():
     
     # Test 4: Make authenticated request WITH token
     print("\n4️⃣  Testing Authenticated Request (With Token - Should Succeed)...")
-    auth_response = requests.get(
-        f"{BASE_URL}/narrator/me",
-        headers={
-            "Authorization": f"Bearer {token}"
-        }
-    )
-    
     print(f"   Status: {auth_response.status_code}")
     if auth_response.status_code != 200:
         print(f"   ❌ Authenticated request failed: {auth_response.text}")
@@ -127,13 +129,6 @@ def test_flutter_auth_integration():
     
     # Test 6: Test invalid token
     print("\n6️⃣  Testing Invalid Token...")
-    invalid_response = requests.get(
-        f"{BASE_URL}/narrator/me",
-        headers={
-            "Authorization": "Bearer invalid_token_12345"
-        }
-    )
-    
     print(f"   Status: {invalid_response.status_code}")
     if invalid_response.status_code == 401:
         print(f"   ✅ Correctly rejected invalid token")
@@ -169,7 +164,7 @@ if __name__ == "__main__":
         if not success:
             print("\n❌ SOME TESTS FAILED")
             exit(1)
-    except requests.exceptions.ConnectionError:
+    except httpx.ConnectError:
         print("❌ ERROR: Cannot connect to server. Is it running on port 8000?")
         exit(1)
     except Exception as e:
@@ -0,0 +1,39 @@
+"""
+Shared psycopg2 connection pool for the standalone database test scripts
+Connections are opened once and reused instead of reconnecting per test
+"""
+import atexit
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from psycopg2.extensions import connection
+from psycopg2.pool import ThreadedConnectionPool
+
+from app.core.config import settings
+
+
+_pool: Optional[ThreadedConnectionPool] = None
+
+
+def get_pool() -> ThreadedConnectionPool:
+    """Create the pool on first use so importing this module never connects"""
+    global _pool
+    if _pool is None:
+        _pool = ThreadedConnectionPool(minconn=1, maxconn=5, dsn=settings.DATABASE_URL)
+        atexit.register(_pool.closeall)
+    return _pool
+
+
+@contextmanager
+def borrow() -> Iterator[connection]:
+    """
+    Borrow a pooled connection for the duration of a with-block.
+    putconn() rolls back any transaction left open before the
+    connection is handed to the next borrower.
+    """
+    pool = get_pool()
+    conn = pool.getconn()
+    try:
+        yield conn
+    finally:
+        pool.putconn(conn)
@@ -1,27 +1,29 @@
 """
 Shared test fixtures and configuration for pytest
 """
+import asyncio
+import re
 import pytest
 import pytest_asyncio
 from unittest.mock import AsyncMock, Mock
 import sys
 import os
-import httpx
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
-from sqlalchemy.pool import NullPool
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING
 
-# Load environment variables from .env file
-load_dotenv()
+# Heavy imports (SQLAlchemy async, httpx, the FastAPI app) are deferred to the
+# fixtures that need them, so pure unit tests don't pay for them at collection
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession
+
+# Cheap bcrypt rounds for every user the tests register; must be set before
+# app.core.config is first imported
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+# .env is loaded once by the root conftest.py, which pytest imports first
 
 # Add the parent directory to Python path for imports
 sys.path.insert(0, os.path.dirname(os.path.dirname(__file__)))
 
-# Import after adding to path
-from app.core.database import Base, get_db
-from main import app
-
 
 # Test database URL - use the same database as development (or TEST_DATABASE_URL if set)
 # In production, use a separate test database
@@ -29,44 +31,205 @@ TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL") or os.getenv("DATABASE_URL")
 if not TEST_DATABASE_URL:
     raise ValueError("DATABASE_URL or TEST_DATABASE_URL environment variable must be set")
 
-# Convert postgresql:// to postgresql+asyncpg:// if needed
-if TEST_DATABASE_URL.startswith("postgresql://"):
-    TEST_DATABASE_URL = TEST_DATABASE_URL.replace("postgresql://", "postgresql+asyncpg://", 1)
+# Convert postgresql:// to postgresql+asyncpg:// if needed; URLs that already
+# name a driver (postgresql+psycopg://, ...) are left untouched
+_DRIVER_RX = re.compile(r"^postgresql(?!\+)")
+TEST_DATABASE_URL = _DRIVER_RX.sub("postgresql+asyncpg", TEST_DATABASE_URL, count=1)
 
 
-@pytest_asyncio.fixture
-async def db_session():
-    """Create a test database session using existing tables"""
+@pytest.fixture(scope="session")
+def event_loop():
+    """One event loop for the whole run so session-scoped async fixtures can share it"""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_engine():
+    """Create the async engine once per test run"""
+    from sqlalchemy.ext.asyncio import create_async_engine
+    
+    # A small real pool lets tests reuse connections instead of reconnecting each time
     engine = create_async_engine(
         TEST_DATABASE_URL,
-        poolclass=NullPool,
+        pool_size=2,
+        max_overflow=2,
+        pool_pre_ping=True,
+        pool_recycle=1800,
         echo=False,
     )
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def db_connection(db_engine):
+    """
+    One connection and one outer transaction for the whole run.
+    Nothing written through it is ever committed.
+    """
+    async with db_engine.connect() as conn:
+        trans = await conn.begin()
+        yield conn
+        await trans.rollback()
+
+
+@pytest_asyncio.fixture
+async def db_session(db_connection):
+    """
+    Create a test database session using existing tables.
+    Each test gets its own SAVEPOINT on the shared connection, rolled back
+    afterwards; commits made by the code under test only release a nested one.
+    """
+    from sqlalchemy.ext.asyncio import AsyncSession
     
-    async_session = async_sessionmaker(
-        engine,
-        class_=AsyncSession,
+    savepoint = await db_connection.begin_nested()
+    async with AsyncSession(
+        bind=db_connection,
         expire_on_commit=False,
-    )
-    
-    async with async_session() as session:
+        join_transaction_mode="create_savepoint",
+    ) as session:
         yield session
+    await savepoint.rollback()
+
+
+@pytest_asyncio.fixture(scope="session")
+async def http_client():
+    """One ASGI HTTP client shared by every test in the run"""
+    from httpx import ASGITransport, AsyncClient
+    from main import app
     
-    await engine.dispose()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        yield client
 
 
 @pytest_asyncio.fixture
-async def async_client(db_session: AsyncSession):
-    """Create an async HTTP client for testing"""
+async def async_client(http_client, db_session: "AsyncSession"):
+    """Shared HTTP client with the app's database dependency bound to this test's session"""
+    from app.core.database import get_db
+    from main import app
+    
     async def override_get_db():
         yield db_session
     
     app.dependency_overrides[get_db] = override_get_db
+    yield http_client
+    app.dependency_overrides.clear()
+
+
+async def _signup_and_login(client, prefix: str) -> tuple[str, str]:
+    """
+    Register a fresh user named after prefix and log it in.
+    Returns (email, access_token); get_db must already point at a session
+    that commits, since login runs in a separate request.
+    """
+    import secrets
     
-    async with AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://test") as client:
-        yield client
+    username = f"{prefix}_{secrets.token_hex(4)}"
+    email = f"{username}@example.com"
+    password = "TestPassword123!"
     
-    app.dependency_overrides.clear()
+    signup_response = await client.post(
+        "/auth/register",
+        json={"email": email, "password": password, "username": username},
+    )
+    assert signup_response.status_code in [200, 201], f"Signup failed: {signup_response.text}"
+    
+    login_response = await client.post(
+        "/auth/token",
+        data={"username": email, "password": password},
+    )
+    assert login_response.status_code == 200, f"Login failed: {login_response.text}"
+    return email, login_response.json()["access_token"]
+
+
+@pytest_asyncio.fixture(scope="module")
+async def authed_headers(http_client, db_engine):
+    """
+    Sign up and log in one user per test module and return its bearer header.
+    The user is committed for real so every test's rolled-back session can see
+    it, and is deleted again (cascading to its campaigns) after the module.
+    """
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from app.core.database import get_db
+    from main import app
+    
+    async with AsyncSession(db_engine, expire_on_commit=False) as session:
+        async def override_get_db():
+            yield session
+        
+        app.dependency_overrides[get_db] = override_get_db
+        try:
+            email, token = await _signup_and_login(http_client, "module")
+        finally:
+            app.dependency_overrides.clear()
+    
+    yield {"Authorization": f"Bearer {token}"}
+    
+    async with db_engine.begin() as conn:
+        await conn.execute(text("DELETE FROM users WHERE email = :email"), {"email": email})
+
+
+@pytest_asyncio.fixture
+async def preauthed_headers(db_session):
+    """
+    Bearer header for a user inserted straight into the test's rolled-back
+    session, for tests that only need an authenticated caller. Skips the
+    register/token endpoints and bcrypt; the user can't log in by password.
+    """
+    import secrets
+    from app.models.user import User
+    from app.utils.auth import create_access_token
+    
+    username = f"preauth_{secrets.token_hex(4)}"
+    user = User(username=username, email=f"{username}@example.com", hashed_password="!")
+    db_session.add(user)
+    await db_session.flush()
+    
+    return {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+
+
+@pytest.fixture(scope="session")
+def settings():
+    """The app's cached settings object, imported on first use"""
+    from app.core.config import get_settings
+    return get_settings()
+
+
+@pytest.fixture(scope="session")
+def origins():
+    """Origin data, loaded once per test session"""
+    from app.services.game_data_service import load_origins
+    return load_origins()
+
+
+@pytest.fixture(scope="session")
+def paths():
+    """Path data, loaded once per test session"""
+    from app.services.game_data_service import load_paths
+    return load_paths()
+
+
+@pytest.fixture(scope="session")
+def talents():
+    """Talent data, loaded once per test session"""
+    from app.services.game_data_service import load_talents
+    return load_talents()
+
+
+@pytest.fixture(scope="session")
+def talent_with_skill_req(talents):
+    """First talent that requires specific skills, or None if there isn't one"""
+    return next((t for t in talents if t["requirements"].get("skills")), None)
+
+
+@pytest.fixture(scope="session")
+def broken_kingdom_template():
+    """The default campaign template, loaded once per test session"""
+    from app.services.campaign_template_service import load_campaign_template
+    return load_campaign_template("broken_kingdom")
 
 
 @pytest.fixture
@@ -16,9 +16,9 @@ from app.services.campaign_template_service import (
 class TestCampaignTemplateLoading:
     """Test campaign template loading functionality"""
 
-    def test_load_broken_kingdom_template(self):
+    def test_load_broken_kingdom_template(self, broken_kingdom_template):
         """Test loading the default 'broken_kingdom' template"""
-        template = load_campaign_template("broken_kingdom")
+        template = broken_kingdom_template
 
         assert template is not None
         assert template["template_id"] == "broken_kingdom"
@@ -33,15 +33,10 @@ class TestCampaignTemplateLoading:
 
         assert template is None
 
-    def test_template_caching(self):
+    def test_template_caching(self, broken_kingdom_template):
         """Test that templates are cached after first load"""
-        # First load
-        template1 = load_campaign_template("broken_kingdom")
-        # Second load (should be cached)
-        template2 = load_campaign_template("broken_kingdom")
-
-        # Should be the same object (cached)
-        assert template1 is template2
+        # Should be the same object the session fixture loaded (cached)
+        assert load_campaign_template("broken_kingdom") is broken_kingdom_template
 
 
 class TestOpeningNarration:
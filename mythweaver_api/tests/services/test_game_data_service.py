@@ -2,6 +2,8 @@
 Tests for Game Data Service
 Verifies origins, paths, and talents loading and validation
 """
+import operator
+
 import pytest
 from app.services.game_data_service import (
     load_origins,
@@ -16,62 +18,47 @@ from app.services.game_data_service import (
     validate_talent,
 )
 
+# Pull every required field in one call; a missing key raises KeyError
+_ORIGIN_FIELDS = operator.itemgetter("id", "name", "description")
+_PATH_FIELDS = operator.itemgetter("id", "name", "description")
+_TALENT_FIELDS = operator.itemgetter("id", "name", "description", "cost", "requirements")
+
 
 class TestOriginLoading:
     """Test origin data loading"""
 
-    def test_load_origins_returns_list(self):
+    def test_load_origins_returns_list(self, origins):
         """Test that load_origins returns a list"""
-        origins = load_origins()
-
         assert isinstance(origins, list)
         assert len(origins) > 0
 
-    def test_origins_have_required_fields(self):
+    def test_origins_have_required_fields(self, origins):
         """Test that all origins have required fields"""
-        origins = load_origins()
-
         for origin in origins:
-            assert "id" in origin
-            assert "name" in origin
-            assert "description" in origin
-            assert isinstance(origin["id"], str)
-            assert isinstance(origin["name"], str)
-            assert isinstance(origin["description"], str)
+            origin_id, name, description = _ORIGIN_FIELDS(origin)
+            assert isinstance(origin_id, str)
+            assert isinstance(name, str)
+            assert isinstance(description, str)
 
-    def test_get_origin_by_id_street_urchin(self):
-        """Test getting street urchin origin by ID"""
-        origin = get_origin_by_id("street_urchin")
+    @pytest.mark.parametrize("origin_id", ["street_urchin", "veteran", "acolyte"])
+    def test_get_origin_by_id(self, origin_id):
+        """Test getting each starting origin by ID"""
+        origin = get_origin_by_id(origin_id)
 
         assert origin is not None
-        assert origin["id"] == "street_urchin"
+        assert origin["id"] == origin_id
         assert "name" in origin
 
-    def test_get_origin_by_id_veteran(self):
-        """Test getting veteran origin by ID"""
-        origin = get_origin_by_id("veteran")
-
-        assert origin is not None
-        assert origin["id"] == "veteran"
-
-    def test_get_origin_by_id_acolyte(self):
-        """Test getting acolyte origin by ID"""
-        origin = get_origin_by_id("acolyte")
-
-        assert origin is not None
-        assert origin["id"] == "acolyte"
-
     def test_get_origin_by_id_nonexistent(self):
         """Test getting nonexistent origin returns None"""
         origin = get_origin_by_id("nonexistent_origin")
 
         assert origin is None
 
-    def test_validate_origin_valid(self):
+    @pytest.mark.parametrize("origin_id", ["street_urchin", "veteran", "acolyte"])
+    def test_validate_origin_valid(self, origin_id):
         """Test validating a valid origin ID"""
-        assert validate_origin("street_urchin") is True
-        assert validate_origin("veteran") is True
-        assert validate_origin("acolyte") is True
+        assert validate_origin(origin_id) is True
 
     def test_validate_origin_invalid(self):
         """Test validating an invalid origin ID"""
@@ -81,58 +68,38 @@ class TestOriginLoading:
 class TestPathLoading:
     """Test path data loading"""
 
-    def test_load_paths_returns_list(self):
+    def test_load_paths_returns_list(self, paths):
         """Test that load_paths returns a list"""
-        paths = load_paths()
-
         assert isinstance(paths, list)
         assert len(paths) > 0
 
-    def test_paths_have_required_fields(self):
+    def test_paths_have_required_fields(self, paths):
         """Test that all paths have required fields"""
-        paths = load_paths()
-
         for path in paths:
-            assert "id" in path
-            assert "name" in path
-            assert "description" in path
-            assert isinstance(path["id"], str)
-            assert isinstance(path["name"], str)
-            assert isinstance(path["description"], str)
+            path_id, name, description = _PATH_FIELDS(path)
+            assert isinstance(path_id, str)
+            assert isinstance(name, str)
+            assert isinstance(description, str)
 
-    def test_get_path_by_id_blade(self):
-        """Test getting blade path by ID"""
-        path = get_path_by_id("blade")
+    @pytest.mark.parametrize("path_id", ["blade", "shadow", "mystic"])
+    def test_get_path_by_id(self, path_id):
+        """Test getting each path by ID"""
+        path = get_path_by_id(path_id)
 
         assert path is not None
-        assert path["id"] == "blade"
+        assert path["id"] == path_id
         assert "name" in path
 
-    def test_get_path_by_id_shadow(self):
-        """Test getting shadow path by ID"""
-        path = get_path_by_id("shadow")
-
-        assert path is not None
-        assert path["id"] == "shadow"
-
-    def test_get_path_by_id_mystic(self):
-        """Test getting mystic path by ID"""
-        path = get_path_by_id("mystic")
-
-        assert path is not None
-        assert path["id"] == "mystic"
-
     def test_get_path_by_id_nonexistent(self):
         """Test getting nonexistent path returns None"""
         path = get_path_by_id("nonexistent_path")
 
         assert path is None
 
-    def test_validate_path_valid(self):
+    @pytest.mark.parametrize("path_id", ["blade", "shadow", "mystic"])
+    def test_validate_path_valid(self, path_id):
         """Test validating valid path IDs"""
-        assert validate_path("blade") is True
-        assert validate_path("shadow") is True
-        assert validate_path("mystic") is True
+        assert validate_path(path_id) is True
 
     def test_validate_path_invalid(self):
         """Test validating an invalid path ID"""
@@ -142,27 +109,19 @@ class TestPathLoading:
 class TestTalentLoading:
     """Test talent data loading"""
 
-    def test_load_talents_returns_list(self):
+    def test_load_talents_returns_list(self, talents):
         """Test that load_talents returns a list"""
-        talents = load_talents()
-
         assert isinstance(talents, list)
         assert len(talents) >= 6  # Should have at least a few talents
 
-    def test_talents_have_required_fields(self):
+    def test_talents_have_required_fields(self, talents):
         """Test that all talents have required fields"""
-        talents = load_talents()
-
         for talent in talents:
-            assert "id" in talent
-            assert "name" in talent
-            assert "description" in talent
-            assert "cost" in talent
-            assert "requirements" in talent
-            assert isinstance(talent["id"], str)
-            assert isinstance(talent["name"], str)
-            assert isinstance(talent["cost"], int)
-            assert isinstance(talent["requirements"], dict)
+            talent_id, name, _description, cost, requirements = _TALENT_FIELDS(talent)
+            assert isinstance(talent_id, str)
+            assert isinstance(name, str)
+            assert isinstance(cost, int)
+            assert isinstance(requirements, dict)
 
     def test_get_talent_by_id_riposte(self):
         """Test getting riposte talent by ID"""
@@ -247,61 +206,43 @@ class TestTalentValidation:
 
         assert is_valid is False
 
-    def test_validate_talent_with_skill_requirements(self):
+    def test_validate_talent_with_skill_requirements(self, talent_with_skill_req):
         """Test validating a talent that requires specific skills"""
-        # Find a talent with skill requirements from the talents list
-        talents = load_talents()
-        talent_with_skill_req = None
+        if talent_with_skill_req is None:
+            pytest.skip("No talent with skill requirements in the data")
+
+        required_skills = talent_with_skill_req["requirements"]["skills"]
+        path = talent_with_skill_req["requirements"]["path"]
+
+        # Should be valid if character has at least one required skill
+        is_valid = validate_talent(
+            talent_with_skill_req["id"],
+            path or "blade",  # Use any path if universal
+            required_skills[:1]  # Include one required skill
+        )
+        assert is_valid is True
 
-        for talent in talents:
-            if talent["requirements"].get("skills"):
-                talent_with_skill_req = talent
-                break
-
-        if talent_with_skill_req:
-            required_skills = talent_with_skill_req["requirements"]["skills"]
-            path = talent_with_skill_req["requirements"]["path"]
-
-            # Should be valid if character has at least one required skill
-            is_valid = validate_talent(
-                talent_with_skill_req["id"],
-                path or "blade",  # Use any path if universal
-                required_skills[:1]  # Include one required skill
-            )
-            assert is_valid is True
-
-            # Should be invalid if character has no required skills
-            is_valid_without_skills = validate_talent(
-                talent_with_skill_req["id"],
-                path or "blade",
-                ["Lore", "Craft"]  # Different skills (capitalized to match data format)
-            )
-            # Only assert false if the talent actually requires skills
-            if required_skills:
-                assert is_valid_without_skills is False
+        # Should be invalid if character has no required skills
+        is_valid_without_skills = validate_talent(
+            talent_with_skill_req["id"],
+            path or "blade",
+            ["Lore", "Craft"]  # Different skills (capitalized to match data format)
+        )
+        assert is_valid_without_skills is False
 
 
 class TestDataCaching:
     """Test that data is cached properly"""
 
-    def test_origins_are_cached(self):
+    def test_origins_are_cached(self, origins):
         """Test that origins are cached after first load"""
-        origins1 = load_origins()
-        origins2 = load_origins()
+        # Should be the same object the session fixture loaded (cached)
+        assert load_origins() is origins
 
-        # Should be the same object (cached)
-        assert origins1 is origins2
-
-    def test_paths_are_cached(self):
+    def test_paths_are_cached(self, paths):
         """Test that paths are cached after first load"""
-        paths1 = load_paths()
-        paths2 = load_paths()
-
-        assert paths1 is paths2
+        assert load_paths() is paths
 
-    def test_talents_are_cached(self):
+    def test_talents_are_cached(self, talents):
         """Test that talents are cached after first load"""
-        talents1 = load_talents()
-        talents2 = load_talents()
-
-        assert talents1 is talents2
+        assert load_talents() is talents
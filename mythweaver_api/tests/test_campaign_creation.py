@@ -2,94 +2,78 @@
 Integration tests for campaign creation workflow.
 
 Tests the complete flow:
-1. User signup
-2. User login
+1. User signup (once per module, via the authed_headers fixture)
+2. User login (likewise)
 3. Create campaign with character
 4. Retrieve campaign
 5. Verify character stats
+
+The validation and 404 tests only need an authenticated caller, so they use
+preauthed_headers, a user inserted directly into the rolled-back session.
 """
+import copy
+import re
+
 import pytest
-import random
-import string
 from httpx import AsyncClient
+from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.schemas.character import CharacterCreate
+
+
+# A valid Shadow/Street Urchin request; tests override what they need via make_campaign
+_BASE_CAMPAIGN_REQUEST = {
+    "campaign_name": "Test Campaign",
+    "template_id": "broken_kingdom",
+    "character": {
+        "name": "Aria Shadowblade",
+        "origin_id": "street_urchin",
+        "path_id": "shadow",
+        "attributes": {"might": 3, "agility": 6, "wits": 4, "presence": 2},
+        "skills": {
+            "blade": 0, "bow": 0, "brawl": 0, "sneak": 2,
+            "survival": 1, "lore": 0, "craft": 0, "influence": 0,
+            "insight": 1, "channel": 0
+        },
+        "talent_ids": ["smoke_step", "backstab"],
+    },
+    "settings": {
+        "tone": "gritty",
+        "content_limits": ["none"],
+        "difficulty": "balanced",
+    },
+}
+
+
+# Military/veteran-related words; any one in the narration marks it as veteran-themed
+_VETERAN_KEYWORDS = re.compile(
+    r"veteran|soldier|war|battle|unit|discharge|military|combat", re.IGNORECASE
+)
 
-def random_username(prefix="testuser"):
-    """Generate a random username for testing"""
-    suffix = ''.join(random.choices(string.ascii_lowercase + string.digits, k=8))
-    return f"{prefix}_{suffix}"
+
+def make_campaign(character=None, **overrides):
+    """Return a fresh copy of the base request with top-level and character fields overridden"""
+    request = copy.deepcopy(_BASE_CAMPAIGN_REQUEST)
+    request.update(overrides)
+    if character:
+        request["character"].update(character)
+    return request
 
 
 @pytest.mark.asyncio
-async def test_full_campaign_creation_flow(async_client: AsyncClient, db_session: AsyncSession):
+async def test_full_campaign_creation_flow(async_client: AsyncClient, db_session: AsyncSession, authed_headers):
     """
-    Test the complete campaign creation flow from signup to campaign retrieval.
+    Test the complete campaign creation flow from an authenticated user to campaign retrieval.
+    Signup and login (steps 1-2) happen once per module in the authed_headers fixture.
     """
-    # Step 1: Signup
-    username = random_username("campaign")
-    email = f"{username}@example.com"
-    password = "TestPassword123!"
-
-    signup_data = {
-        "email": email,
-        "password": password,
-        "username": username,
-    }
-    signup_response = await async_client.post("/auth/register", json=signup_data)
-    assert signup_response.status_code in [200, 201], f"Signup failed: {signup_response.text}"
-
-    # Step 2: Login
-    login_response = await async_client.post(
-        "/auth/token",
-        data={
-            "username": email,
-            "password": password,
-        }
-    )
-    assert login_response.status_code == 200, f"Login failed: {login_response.text}"
-    token_data = login_response.json()
-    access_token = token_data["access_token"]
-    
     # Step 3: Create campaign with character
-    campaign_request = {
-        "campaign_name": "Test Campaign",
-        "template_id": "broken_kingdom",
-        "character": {
-            "name": "Aria Shadowblade",
-            "origin_id": "street_urchin",
-            "path_id": "shadow",
-            "attributes": {
-                "might": 3,
-                "agility": 6,
-                "wits": 4,
-                "presence": 2
-            },
-            "skills": {
-                "blade": 0,
-                "bow": 0,
-                "brawl": 0,
-                "sneak": 2,
-                "survival": 1,
-                "lore": 0,
-                "craft": 0,
-                "influence": 0,
-                "insight": 1,
-                "channel": 0
-            },
-            "talent_ids": ["smoke_step", "backstab"]
-        },
-        "settings": {
-            "tone": "gritty",
-            "content_limits": ["none"],
-            "difficulty": "balanced"
-        }
-    }
+    campaign_request = make_campaign()
     
     create_response = await async_client.post(
         "/campaign/create",
         json=campaign_request,
-        headers={"Authorization": f"Bearer {access_token}"}
+        headers=authed_headers
     )
     
     assert create_response.status_code == 201, f"Failed: {create_response.text}"
@@ -100,6 +84,7 @@ async def test_full_campaign_creation_flow(async_client: AsyncClient, db_session
     assert "character_id" in campaign_data
     assert "opening_narration" in campaign_data
     assert "suggested_actions" in campaign_data
+    assert "character" in campaign_data
     
     # Verify opening narration contains origin-specific context
     assert len(campaign_data["opening_narration"]) > 100
@@ -114,7 +99,7 @@ async def test_full_campaign_creation_flow(async_client: AsyncClient, db_session
     # Step 4: Retrieve campaign
     get_response = await async_client.get(
         f"/campaign/{campaign_id}",
-        headers={"Authorization": f"Bearer {access_token}"}
+        headers=authed_headers
     )
     
     assert get_response.status_code == 200
@@ -126,122 +111,77 @@ async def test_full_campaign_creation_flow(async_client: AsyncClient, db_session
     assert retrieved_campaign["template_id"] == "broken_kingdom"
     assert retrieved_campaign["current_location"] == "The Crossroads Inn"
     assert retrieved_campaign["chapter_number"] == 1
-    
-    # Step 5: Verify character stats
-    assert retrieved_campaign["character"] is not None
-    character = retrieved_campaign["character"]
-    
-    assert character["id"] == character_id
-    assert character["name"] == "Aria Shadowblade"
-    assert character["origin_id"] == "street_urchin"
-    assert character["path_id"] == "shadow"
-    
-    # Verify attributes
-    assert character["might_score"] == 3
-    assert character["agility_score"] == 6
-    assert character["wits_score"] == 4
-    assert character["presence_score"] == 2
-    
-    # Verify derived stats
-    # HP = 8 + (might * 2) = 8 + (3 * 2) = 14
-    assert character["max_hp"] == 14
-    assert character["current_hp"] == 14
-    
-    # Focus = 4 + wits + presence = 4 + 4 + 2 = 10
-    assert character["max_focus"] == 10
-    assert character["current_focus"] == 10
-    
-    # Supplies = 3 (default)
-    assert character["supplies"] == 3
-    
-    # Inventory slots = might // 2 = 3 // 2 = 1
-    assert character["inventory_slots"] == 1
+    assert retrieved_campaign["character"]["id"] == character_id
+    
+    # Step 5: Verify character stats, as returned by the create call
+    character = campaign_data["character"]
+    
+    expected = {
+        "id": character_id,
+        "name": "Aria Shadowblade",
+        "origin_id": "street_urchin",
+        "path_id": "shadow",
+        # Attributes
+        "might_score": 3,
+        "agility_score": 6,
+        "wits_score": 4,
+        "presence_score": 2,
+        # HP = 8 + (might * 2) = 8 + (3 * 2) = 14
+        "max_hp": 14,
+        "current_hp": 14,
+        # Focus = 4 + wits + presence = 4 + 4 + 2 = 10
+        "max_focus": 10,
+        "current_focus": 10,
+        # Supplies = 3 (default)
+        "supplies": 3,
+        # Inventory slots = might // 2 = 3 // 2 = 1
+        "inventory_slots": 1,
+    }
+    assert {k: character[k] for k in expected} == expected
     
     # Verify skills
-    assert character["skills"]["sneak"] == 2
-    assert character["skills"]["survival"] == 1
-    assert character["skills"]["insight"] == 1
+    assert {k: character["skills"][k] for k in ("sneak", "survival", "insight")} == {
+        "sneak": 2, "survival": 1, "insight": 1
+    }
 
 
 @pytest.mark.asyncio
-async def test_campaign_creation_with_blade_character(async_client: AsyncClient, db_session: AsyncSession):
+async def test_campaign_creation_with_blade_character(async_client: AsyncClient, db_session: AsyncSession, authed_headers):
     """
     Test campaign creation with a Blade archetype character.
     """
-    # Signup and login
-    username = random_username("blade")
-    email = f"{username}@example.com"
-    password = "TestPassword123!"
-
-    signup_data = {
-        "email": email,
-        "password": password,
-        "username": username,
-    }
-    await async_client.post("/auth/register", json=signup_data)
-
-    login_response = await async_client.post(
-        "/auth/token",
-        data={
-            "username": email,
-            "password": password,
-        }
-    )
-    access_token = login_response.json()["access_token"]
-    
     # Create campaign with Blade character
-    campaign_request = {
-        "campaign_name": "Blade's Journey",
-        "template_id": "broken_kingdom",
-        "character": {
+    campaign_request = make_campaign(
+        campaign_name="Blade's Journey",
+        character={
             "name": "Kael Ironfist",
             "origin_id": "veteran",
             "path_id": "blade",
-            "attributes": {
-                "might": 6,
-                "agility": 4,
-                "wits": 3,
-                "presence": 2
-            },
+            "attributes": {"might": 6, "agility": 4, "wits": 3, "presence": 2},
             "skills": {
-                "blade": 2,
-                "bow": 0,
-                "brawl": 1,
-                "sneak": 0,
-                "survival": 1,
-                "lore": 0,
-                "craft": 0,
-                "influence": 0,
-                "insight": 0,
-                "channel": 0
+                "blade": 2, "bow": 0, "brawl": 1, "sneak": 0,
+                "survival": 1, "lore": 0, "craft": 0, "influence": 0,
+                "insight": 0, "channel": 0
             },
-            "talent_ids": ["riposte", "shield_ally"]
-        }
-    }
+            "talent_ids": ["riposte", "shield_ally"],
+        },
+    )
     
     create_response = await async_client.post(
         "/campaign/create",
         json=campaign_request,
-        headers={"Authorization": f"Bearer {access_token}"}
+        headers=authed_headers
     )
     
     assert create_response.status_code == 201
     campaign_data = create_response.json()
 
     # Verify veteran-specific narration (check for military/veteran-related keywords)
-    narration_lower = campaign_data["opening_narration"].lower()
-    veteran_keywords = ["veteran", "soldier", "war", "battle", "unit", "discharge", "military", "combat"]
-    assert any(keyword in narration_lower for keyword in veteran_keywords), \
+    assert _VETERAN_KEYWORDS.search(campaign_data["opening_narration"]), \
         f"Expected veteran-themed narration, got: {campaign_data['opening_narration']}"
     
-    # Get campaign and verify stats
-    campaign_id = campaign_data["campaign_id"]
-    get_response = await async_client.get(
-        f"/campaign/{campaign_id}",
-        headers={"Authorization": f"Bearer {access_token}"}
-    )
-    
-    character = get_response.json()["character"]
+    # Verify stats on the character returned by the create call
+    character = campaign_data["character"]
     
     # HP = 8 + (6 * 2) = 20
     assert character["max_hp"] == 20
@@ -254,111 +194,56 @@ async def test_campaign_creation_with_blade_character(async_client: AsyncClient,
 
 
 @pytest.mark.asyncio
-async def test_campaign_creation_validation_errors(async_client: AsyncClient):
+async def test_campaign_creation_validation_errors(async_client: AsyncClient, preauthed_headers):
     """
     Test that campaign creation fails with invalid character data.
     """
-    # Signup and login
-    username = random_username("validation")
-    email = f"{username}@example.com"
-    password = "TestPassword123!"
-
-    signup_data = {
-        "email": email,
-        "password": password,
-        "username": username,
-    }
-    await async_client.post("/auth/register", json=signup_data)
-
-    login_response = await async_client.post(
-        "/auth/token",
-        data={
-            "username": email,
-            "password": password,
-        }
-    )
-    access_token = login_response.json()["access_token"]
-    
     # Test 1: Invalid attributes sum (should be 15)
-    invalid_request = {
-        "campaign_name": "Invalid Campaign",
-        "template_id": "broken_kingdom",
-        "character": {
+    invalid_request = make_campaign(
+        campaign_name="Invalid Campaign",
+        character={
             "name": "Invalid Character",
-            "origin_id": "street_urchin",
-            "path_id": "shadow",
-            "attributes": {
-                "might": 10,  # Sum is 22, not 15
-                "agility": 6,
-                "wits": 4,
-                "presence": 2
-            },
-            "skills": {
-                "blade": 0, "bow": 0, "brawl": 0, "sneak": 2,
-                "survival": 1, "lore": 0, "craft": 0, "influence": 0,
-                "insight": 1, "channel": 0
-            },
-            "talent_ids": ["smoke_step", "backstab"]
-        }
-    }
+            # Sum is 22, not 15
+            "attributes": {"might": 10, "agility": 6, "wits": 4, "presence": 2},
+        },
+    )
     
     response = await async_client.post(
         "/campaign/create",
         json=invalid_request,
-        headers={"Authorization": f"Bearer {access_token}"}
+        headers=preauthed_headers
     )
 
     # Pydantic validation returns 422 (Unprocessable Entity), not 400
     assert response.status_code == 422
     assert "attribute" in response.text.lower()
     
-    # Test 2: Wrong number of skills (should be exactly 3)
-    invalid_request["character"]["attributes"] = {
-        "might": 3, "agility": 6, "wits": 4, "presence": 2
-    }
+    # The skill-count rule goes through the same 422 path; it's checked
+    # against the schema directly in test_campaign_skill_count_rejected
+
+
+def test_campaign_skill_count_rejected():
+    """
+    Test that a character with the wrong number of skills is rejected.
+    Validated against the request schema directly, without the HTTP stack.
+    """
+    invalid_request = make_campaign()
     invalid_request["character"]["skills"]["sneak"] = 0  # Now only 2 skills selected
     
-    response = await async_client.post(
-        "/campaign/create",
-        json=invalid_request,
-        headers={"Authorization": f"Bearer {access_token}"}
-    )
-
-    # Pydantic validation returns 422 (Unprocessable Entity)
-    assert response.status_code == 422
+    with pytest.raises(ValidationError, match="exactly 3 starting skills"):
+        CharacterCreate(**invalid_request["character"])
 
 
 @pytest.mark.asyncio
-async def test_get_campaign_not_found(async_client: AsyncClient):
+async def test_get_campaign_not_found(async_client: AsyncClient, preauthed_headers):
     """
     Test that retrieving a non-existent campaign returns 404.
     """
-    # Signup and login
-    username = random_username("notfound")
-    email = f"{username}@example.com"
-    password = "TestPassword123!"
-
-    signup_data = {
-        "email": email,
-        "password": password,
-        "username": username,
-    }
-    await async_client.post("/auth/register", json=signup_data)
-
-    login_response = await async_client.post(
-        "/auth/token",
-        data={
-            "username": email,
-            "password": password,
-        }
-    )
-    access_token = login_response.json()["access_token"]
-    
     # Try to get a non-existent campaign
     fake_uuid = "00000000-0000-0000-0000-000000000000"
     response = await async_client.get(
         f"/campaign/{fake_uuid}",
-        headers={"Authorization": f"Bearer {access_token}"}
+        headers=preauthed_headers
     )
     
     assert response.status_code == 404
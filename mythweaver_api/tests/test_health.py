@@ -0,0 +1,58 @@
+"""
+Tests for the /health endpoint
+The database ping is replaced so these run without a database
+"""
+import pytest
+
+import main
+
+
+@pytest.fixture
+def db_ping(monkeypatch):
+    """Fake the database ping; set db_ping.error to make it fail. Counts calls."""
+    class FakePing:
+        error = None
+        calls = 0
+        
+        async def __call__(self):
+            self.calls += 1
+            main._record_db_health(self.error is None, self.error)
+    
+    fake = FakePing()
+    monkeypatch.setattr(main, "_ping_database", fake)
+    # Start each test from "not checked yet"
+    monkeypatch.setattr(main, "_DB_HEALTH", {"ok": False, "error": None, "checked_at": 0.0})
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_health_ok(http_client, db_ping):
+    """Test that /health pings on demand and reports healthy without a lifespan"""
+    response = await http_client.get("/health")
+    
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "healthy"
+    assert body["database"] == "connected"
+    assert body["timestamp"].endswith("+00:00")
+    assert db_ping.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_health_reuses_recent_check(http_client, db_ping):
+    """Test that a second probe within DB_HEALTH_TTL doesn't ping again"""
+    await http_client.get("/health")
+    await http_client.get("/health")
+    
+    assert db_ping.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_health_database_down(http_client, db_ping):
+    """Test that /health returns 503 when the database ping fails"""
+    db_ping.error = "connection refused"
+    
+    response = await http_client.get("/health")
+    
+    assert response.status_code == 503
+    assert "connection refused" in response.text
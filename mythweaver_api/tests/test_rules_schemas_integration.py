@@ -2,7 +2,10 @@
 Integration test: Rules Engine + Character Schemas
 Tests that validation works with Pydantic schemas
 """
+from typing import List
+
 import pytest
+from pydantic import TypeAdapter
 from app.schemas.character import (
     AttributeScores,
     SkillsDict,
@@ -106,42 +109,46 @@ def test_invalid_character_schemas():
     print("✅ Invalid character data correctly rejected by schemas")
 
 
+# Raw request payloads for one character per path, validated together below
+_ARCHETYPES = [
+    {
+        "name": "Kael the Blade",
+        "origin_id": "veteran",
+        "path_id": "blade",
+        "attributes": {"might": 6, "agility": 4, "wits": 3, "presence": 2},
+        "skills": {"blade": 8, "brawl": 4, "survival": 4},
+        "talent_ids": ["riposte", "weapon_master"],
+    },
+    {
+        "name": "Vex the Shadow",
+        "origin_id": "street_urchin",
+        "path_id": "shadow",
+        "attributes": {"might": 2, "agility": 6, "wits": 4, "presence": 3},
+        "skills": {"sneak": 8, "bow": 4, "insight": 4},
+        "talent_ids": ["smoke_step", "backstab"],
+    },
+    {
+        "name": "Lyra the Mystic",
+        "origin_id": "acolyte",
+        "path_id": "mystic",
+        "attributes": {"might": 2, "agility": 3, "wits": 6, "presence": 4},
+        "skills": {"channel": 8, "lore": 4, "insight": 4},
+        "talent_ids": ["quick_ritual", "ward"],
+    },
+]
+
+# Built once so the list validator isn't reconstructed per call
+_CHARACTER_LIST = TypeAdapter(List[CharacterCreate])
+
+
 def test_three_character_archetypes():
     """Test creating characters for each path"""
+    blade_char, shadow_char, mystic_char = _CHARACTER_LIST.validate_python(_ARCHETYPES)
     
-    # Blade Warrior
-    blade_char = CharacterCreate(
-        name="Kael the Blade",
-        origin_id="veteran",
-        path_id="blade",
-        attributes=AttributeScores(might=6, agility=4, wits=3, presence=2),
-        skills=SkillsDict(blade=8, brawl=4, survival=4),
-        talent_ids=["riposte", "weapon_master"]
-    )
     blade_hp = calculate_max_hp(blade_char.attributes.might)
     blade_focus = calculate_max_focus(blade_char.attributes.wits, blade_char.attributes.presence)
-    
-    # Shadow Rogue
-    shadow_char = CharacterCreate(
-        name="Vex the Shadow",
-        origin_id="street_urchin",
-        path_id="shadow",
-        attributes=AttributeScores(might=2, agility=6, wits=4, presence=3),
-        skills=SkillsDict(sneak=8, bow=4, insight=4),
-        talent_ids=["smoke_step", "backstab"]
-    )
     shadow_hp = calculate_max_hp(shadow_char.attributes.might)
     shadow_focus = calculate_max_focus(shadow_char.attributes.wits, shadow_char.attributes.presence)
-    
-    # Mystic Caster
-    mystic_char = CharacterCreate(
-        name="Lyra the Mystic",
-        origin_id="acolyte",
-        path_id="mystic",
-        attributes=AttributeScores(might=2, agility=3, wits=6, presence=4),
-        skills=SkillsDict(channel=8, lore=4, insight=4),
-        talent_ids=["quick_ritual", "ward"]
-    )
     mystic_hp = calculate_max_hp(mystic_char.attributes.might)
     mystic_focus = calculate_max_focus(mystic_char.attributes.wits, mystic_char.attributes.presence)
     
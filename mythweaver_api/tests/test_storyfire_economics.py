@@ -2,121 +2,126 @@
 Tests for Storyfire Economics System
 Verifies configuration and exception handling for Storyfire system
 
+Every test here is pure (no DB, no I/O, nothing shared but the read-only
+frozen_sf_settings snapshot), so the file can be spread across workers:
+    pytest tests/test_storyfire_economics.py -n auto
+
 NOTE: Full Storyfire service implementation (Week 4+) will require additional tests for:
 - Storyfire balance tracking
 - Daily Storyfire reset logic
 - Storyfire deduction on actions
 - Premium vs Free tier differentiation
 """
+import types
+
 import pytest
-from app.core.config import settings
-from app.exceptions import StoryfireExhausted
+from app.exceptions import MythweaverException, StoryfireExhausted
+
 
+@pytest.fixture(scope="module")
+def frozen_sf_settings(settings):
+    """
+    Read-only snapshot of the Storyfire economy values, taken once for this
+    module; tests read these instead of (possibly mutated) live settings.
+    """
+    return types.MappingProxyType({
+        "daily": settings.STORYFIRE_FREE_DAILY,
+        "cost": settings.STORYFIRE_COST_PER_ACTION,
+    })
 
-class TestStoryfireConfiguration:
-    """Test Storyfire economic configuration"""
 
-    def test_storyfire_free_daily_is_40(self):
-        """Test that free users get 40 Storyfire daily"""
-        assert settings.STORYFIRE_FREE_DAILY == 40
+# Storyfire economic configuration
 
-    def test_storyfire_cost_per_action_is_2(self):
-        """Test that each action costs 2 Storyfire"""
-        assert settings.STORYFIRE_COST_PER_ACTION == 2
+@pytest.mark.config_contract
+@pytest.mark.parametrize("key,expected", [
+    ("daily", 40),    # Free users get 40 Storyfire daily
+    ("cost", 2),      # Each action costs 2 Storyfire
+])
+def test_storyfire_constant(frozen_sf_settings, key, expected):
+    """Test the configured Storyfire economy values"""
+    assert frozen_sf_settings[key] == expected
 
-    def test_free_users_get_20_actions_per_day(self):
-        """Test that 40 Storyfire = 20 actions for free users"""
-        daily_storyfire = settings.STORYFIRE_FREE_DAILY
-        cost_per_action = settings.STORYFIRE_COST_PER_ACTION
 
-        max_daily_actions = daily_storyfire // cost_per_action
+@pytest.mark.config_contract
+def test_free_users_get_20_actions_per_day(frozen_sf_settings):
+    """Test that 40 Storyfire = 20 actions for free users"""
+    max_daily_actions = frozen_sf_settings["daily"] // frozen_sf_settings["cost"]
 
-        assert max_daily_actions == 20
+    assert max_daily_actions == 20
 
-    def test_storyfire_values_are_positive(self):
-        """Test that Storyfire values are positive integers"""
-        assert settings.STORYFIRE_FREE_DAILY > 0
-        assert settings.STORYFIRE_COST_PER_ACTION > 0
+
+@pytest.mark.config_contract
+def test_storyfire_values_are_positive(frozen_sf_settings):
+    """Test that Storyfire values are positive integers"""
+    assert all(value > 0 for value in frozen_sf_settings.values()), \
+        f"Non-positive Storyfire setting in {dict(frozen_sf_settings)}"
 
 
 class TestStoryfireExhaustedException:
     """Test Storyfire exhausted exception"""
 
-    def test_storyfire_exhausted_exception_creation(self):
-        """Test creating a StoryfireExhausted exception"""
-        exception = StoryfireExhausted()
+    @pytest.mark.parametrize("kwargs,expected", [
+        pytest.param({}, "Storyfire", id="default-names-storyfire"),
+        pytest.param({}, "Premium", id="default-mentions-premium"),
+        pytest.param(
+            {"detail": "You need 5 more Storyfire to perform this action"},
+            "You need 5 more Storyfire to perform this action",
+            id="custom",
+        ),
+    ])
+    def test_storyfire_exhausted_detail(self, kwargs, expected):
+        """Test StoryfireExhausted with its default and a custom message"""
+        exception = StoryfireExhausted(**kwargs)
 
         assert exception.status_code == 402  # Payment Required
-        assert "Storyfire" in exception.detail
-        assert "Premium" in exception.detail
         assert exception.error_code == "STORYFIRE_EXHAUSTED"
+        assert expected in exception.detail
 
-    def test_storyfire_exhausted_custom_message(self):
-        """Test StoryfireExhausted with custom message"""
-        custom_message = "You need 5 more Storyfire to perform this action"
-        exception = StoryfireExhausted(detail=custom_message)
-
-        assert exception.detail == custom_message
-        assert exception.status_code == 402
-
-    def test_storyfire_exhausted_can_be_raised(self):
-        """Test that StoryfireExhausted can be raised and caught"""
-        with pytest.raises(StoryfireExhausted) as exc_info:
-            raise StoryfireExhausted()
-
-        assert exc_info.value.status_code == 402
-        assert exc_info.value.error_code == "STORYFIRE_EXHAUSTED"
+    def test_storyfire_exhausted_is_exception(self):
+        """Test that StoryfireExhausted is raisable and reaches the Mythweaver error handler"""
+        assert issubclass(StoryfireExhausted, MythweaverException)
+        assert issubclass(StoryfireExhausted, Exception)
 
 
 class TestStoryfireBusinessLogic:
     """Test Storyfire business logic calculations"""
 
-    def test_calculate_required_storyfire_for_actions(self):
+    @pytest.mark.parametrize("n_actions,expected_cost", [
+        pytest.param(1, 2, id="1-action"),
+        pytest.param(5, 10, id="5-actions"),
+        pytest.param(20, 40, id="20-actions-full-day"),
+    ])
+    def test_calculate_required_storyfire_for_actions(self, frozen_sf_settings, n_actions, expected_cost):
         """Test calculating Storyfire needed for N actions"""
-        cost_per_action = settings.STORYFIRE_COST_PER_ACTION
-
-        # 1 action = 2 Storyfire
-        assert 1 * cost_per_action == 2
-
-        # 5 actions = 10 Storyfire
-        assert 5 * cost_per_action == 10
-
-        # 20 actions = 40 Storyfire (full daily allowance)
-        assert 20 * cost_per_action == 40
-
-    def test_calculate_max_actions_from_storyfire(self):
+        cost_per_action = frozen_sf_settings["cost"]
+        assert n_actions * cost_per_action == expected_cost
+
+    @pytest.mark.parametrize("storyfire,expected_actions", [
+        pytest.param(10, 5, id="10-storyfire"),
+        pytest.param(40, 20, id="40-storyfire-full-day"),
+        pytest.param(50, 25, id="50-storyfire"),
+    ])
+    def test_calculate_max_actions_from_storyfire(self, frozen_sf_settings, storyfire, expected_actions):
         """Test calculating how many actions can be performed with given Storyfire"""
-        cost_per_action = settings.STORYFIRE_COST_PER_ACTION
-
-        # 10 Storyfire = 5 actions
-        assert 10 // cost_per_action == 5
-
-        # 40 Storyfire = 20 actions
-        assert 40 // cost_per_action == 20
-
-        # 50 Storyfire = 25 actions
-        assert 50 // cost_per_action == 25
-
-    def test_storyfire_remainder_calculation(self):
-        """Test calculating leftover Storyfire after actions"""
-        cost_per_action = settings.STORYFIRE_COST_PER_ACTION
-
-        # Starting with 40, after 1 action should have 38
-        remaining = settings.STORYFIRE_FREE_DAILY - (1 * cost_per_action)
-        assert remaining == 38
-
-        # After 10 actions should have 20
-        remaining = settings.STORYFIRE_FREE_DAILY - (10 * cost_per_action)
-        assert remaining == 20
-
-        # After 20 actions should have 0
-        remaining = settings.STORYFIRE_FREE_DAILY - (20 * cost_per_action)
-        assert remaining == 0
-
-    def test_storyfire_insufficient_check(self):
+        cost_per_action = frozen_sf_settings["cost"]
+        assert storyfire // cost_per_action == expected_actions
+
+    @pytest.mark.parametrize("n_actions,expected_remaining", [
+        pytest.param(1, 38, id="after-1-action"),
+        pytest.param(10, 20, id="after-10-actions"),
+        pytest.param(20, 0, id="after-20-actions"),
+    ])
+    def test_storyfire_remainder_calculation(self, frozen_sf_settings, n_actions, expected_remaining):
+        """Test calculating leftover Storyfire after actions, starting from the daily 40"""
+        daily_storyfire = frozen_sf_settings["daily"]
+        cost_per_action = frozen_sf_settings["cost"]
+        remaining = daily_storyfire - (n_actions * cost_per_action)
+        assert remaining == expected_remaining
+
+    def test_storyfire_insufficient_check(self, frozen_sf_settings):
         """Test checking if user has sufficient Storyfire"""
         current_storyfire = 5
-        cost_per_action = settings.STORYFIRE_COST_PER_ACTION
+        cost_per_action = frozen_sf_settings["cost"]
 
         # 5 Storyfire is enough for 2 actions (costs 4)
         can_perform_2_actions = current_storyfire >= (2 * cost_per_action)
@@ -127,35 +132,22 @@ class TestStoryfireBusinessLogic:
         assert can_perform_3_actions is False
 
 
-class TestStoryfireEdgeCases:
-    """Test edge cases for Storyfire system"""
-
-    def test_zero_storyfire_cannot_perform_actions(self):
-        """Test that 0 Storyfire cannot perform any actions"""
-        current_storyfire = 0
-        cost_per_action = settings.STORYFIRE_COST_PER_ACTION
-
-        can_perform_action = current_storyfire >= cost_per_action
-        assert can_perform_action is False
-
-    def test_one_storyfire_cannot_perform_action(self):
-        """Test that 1 Storyfire cannot perform an action (costs 2)"""
-        current_storyfire = 1
-        cost_per_action = settings.STORYFIRE_COST_PER_ACTION
-
-        can_perform_action = current_storyfire >= cost_per_action
-        assert can_perform_action is False
+# Edge cases for the Storyfire system
 
-    def test_exactly_enough_storyfire(self):
-        """Test having exactly enough Storyfire for an action"""
-        current_storyfire = 2
-        cost_per_action = settings.STORYFIRE_COST_PER_ACTION
+@pytest.mark.parametrize("current_storyfire,expected_ok,expected_remaining", [
+    pytest.param(0, False, None, id="zero-storyfire"),
+    pytest.param(1, False, None, id="one-storyfire"),     # An action costs 2
+    pytest.param(2, True, 0, id="exactly-enough"),
+])
+def test_storyfire_sufficiency(frozen_sf_settings, current_storyfire, expected_ok, expected_remaining):
+    """Test whether a balance can pay for one action, and what's left if it can"""
+    cost_per_action = frozen_sf_settings["cost"]
 
-        can_perform_action = current_storyfire >= cost_per_action
-        assert can_perform_action is True
+    can_perform_action = current_storyfire >= cost_per_action
+    assert can_perform_action is expected_ok
 
-        remaining = current_storyfire - cost_per_action
-        assert remaining == 0
+    if can_perform_action:
+        assert current_storyfire - cost_per_action == expected_remaining
 
 
 # NOTE: Additional tests needed when Storyfire service is implemented (Week 4+):